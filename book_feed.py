@@ -0,0 +1,194 @@
+"""
+PolyGraalX Order Book Feed Module
+
+Streams best bid/ask for Polymarket tokens from the CLOB market WebSocket
+channel, so midpoints can be read from memory instead of a REST round-trip.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Dict, Iterable, Optional, Tuple
+
+import aiohttp
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # Optional dependency: fall back to the stdlib parser
+    from json import loads as _json_loads
+
+logger = logging.getLogger(__name__)
+
+# Polymarket CLOB market-data channel (public, no auth)
+MARKET_WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+
+# The server drops connections that send nothing for a while
+PING_INTERVAL = 10
+
+# Don't wait long for the server's close frame when resubscribing
+WS_CLOSE_TIMEOUT = 2
+
+
+def _best(levels, pick) -> Optional[float]:
+    """Best price among [{"price": "0.45", "size": "10"}, ...] levels (None if empty)."""
+    prices = [float(level["price"]) for level in levels or ()]
+    return pick(prices) if prices else None
+
+
+class BookFeed:
+    """
+    Best bid/ask cache for a set of watched tokens.
+
+    The CLOB pushes book snapshots and price changes only when the book
+    moves, so a cached entry stays valid for as long as the connection is up;
+    the cache is cleared whenever it drops. Reads are plain dict lookups and
+    safe from the CLOB worker threads.
+    """
+
+    def __init__(self, url: str = MARKET_WS_URL):
+        """
+        Args:
+            url: Market channel WebSocket URL
+        """
+        self.url = url
+
+        # token_id -> (best bid, best ask); either side may be None
+        self._book: Dict[str, Tuple[Optional[float], Optional[float]]] = {}
+        self._watched: frozenset = frozenset()
+        self._resubscribe = asyncio.Event()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+
+    def watch(self, token_ids: Iterable[str]) -> None:
+        """
+        Set the tokens to stream; reconnects with the new set if it changed.
+
+        Args:
+            token_ids: Token IDs to keep best bid/ask for
+        """
+        watched = frozenset(token_ids)
+        if watched != self._watched:
+            self._watched = watched
+            self._resubscribe.set()
+            # The subscription is fixed per connection: drop it so stream() reconnects
+            if self._ws is not None and not self._ws.closed:
+                asyncio.ensure_future(self._ws.close())
+
+    def get_midpoint(self, token_id: str) -> Optional[float]:
+        """Cached (bid + ask) / 2 for a token, or None if either side is unknown."""
+        bid, ask = self._book.get(token_id, (None, None))
+        if bid is None or ask is None:
+            return None
+        return (bid + ask) / 2
+
+    async def close(self) -> None:
+        """Close the WebSocket session."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._book.clear()
+
+    def _apply(self, event: dict) -> None:
+        """Update the cache from one market-channel event."""
+        event_type = event.get("event_type")
+
+        if event_type == "book":
+            self._book[event["asset_id"]] = (
+                _best(event.get("bids"), max),
+                _best(event.get("asks"), min)
+            )
+
+        elif event_type == "price_change":
+            for change in event.get("price_changes", ()):
+                best_bid, best_ask = change.get("best_bid"), change.get("best_ask")
+                if best_bid is not None and best_ask is not None:
+                    self._book[change["asset_id"]] = (float(best_bid), float(best_ask))
+
+        elif event_type == "best_bid_ask":
+            self._book[event["asset_id"]] = (
+                float(event["best_bid"]), float(event["best_ask"])
+            )
+
+    async def _consume(self, stop_event: asyncio.Event, tokens: frozenset) -> None:
+        """Subscribe to tokens and apply events until stopped, resubscribed or dropped."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+
+        async with self._session.ws_connect(
+            self.url, timeout=aiohttp.ClientWSTimeout(ws_close=WS_CLOSE_TIMEOUT)
+        ) as ws:
+            self._ws = ws
+            closer = asyncio.create_task(self._close_on_stop(stop_event, ws))
+            try:
+                await ws.send_str(json.dumps({"assets_ids": sorted(tokens), "type": "market"}))
+                logger.info(f"📗 Streaming order books for {len(tokens)} tokens")
+
+                while not stop_event.is_set() and not self._resubscribe.is_set():
+                    try:
+                        msg = await ws.receive(timeout=PING_INTERVAL)
+                    except asyncio.TimeoutError:
+                        await ws.send_str("PING")
+                        continue
+
+                    if msg.type != aiohttp.WSMsgType.TEXT:
+                        if stop_event.is_set() or self._resubscribe.is_set():
+                            return
+                        raise ConnectionError(f"Market channel closed ({msg.type.name})")
+                    if msg.data == "PONG":
+                        continue
+
+                    payload = _json_loads(msg.data)
+                    for event in payload if isinstance(payload, list) else (payload,):
+                        try:
+                            self._apply(event)
+                        except (KeyError, TypeError, ValueError) as e:
+                            logger.debug(f"Skipping malformed book event: {e}")
+            finally:
+                closer.cancel()
+
+    @staticmethod
+    async def _close_on_stop(stop_event: asyncio.Event, ws) -> None:
+        """Close the socket as soon as stop_event is set, so receive() returns."""
+        await stop_event.wait()
+        await ws.close()
+
+    async def stream(self, stop_event: asyncio.Event) -> None:
+        """
+        Keep the cache fed for the watched tokens until stop_event is set.
+
+        Args:
+            stop_event: Event to signal stream termination
+        """
+        reconnect_delay = 1
+
+        while not stop_event.is_set():
+            self._resubscribe.clear()
+            tokens = self._watched
+
+            if not tokens:
+                # Nothing to watch yet: wait for watch() or stop
+                waiters = [
+                    asyncio.ensure_future(self._resubscribe.wait()),
+                    asyncio.ensure_future(stop_event.wait())
+                ]
+                await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+                for waiter in waiters:
+                    waiter.cancel()
+                continue
+
+            try:
+                await self._consume(stop_event, tokens)
+                reconnect_delay = 1
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning(f"Order book stream error: {e}")
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=reconnect_delay)
+                except asyncio.TimeoutError:
+                    pass
+                reconnect_delay = min(reconnect_delay * 2, 30)
+            finally:
+                self._ws = None
+                # Entries are only trustworthy while subscribed
+                self._book.clear()
@@ -19,6 +19,7 @@ class Config:
     funder_address: str
     signature_type: int = 1
     chain_id: int = 137  # Polygon Mainnet
+    cache_api_creds: bool = True  # Keep derived CLOB API credentials in ~/.polygraalx
     
     # Trading Parameters
     bet_amount_usdc: float = 10.0
@@ -33,6 +34,7 @@ class Config:
     
     # Risk Management
     max_positions: int = 2
+    max_concurrent_orders: int = 2  # Orders in flight at once (CLOB rate limit)
     exit_zscore_threshold: float = 0.5
     force_exit_before_expiry: int = 120
     
@@ -66,12 +68,15 @@ class Config:
         """
         load_dotenv(env_file)
         
+        # Snapshot the environment once instead of a getenv call per field
+        env = dict(os.environ)
+        
         # Check if paper trading mode
-        paper_mode = os.getenv("PAPER_TRADING", "false").lower() in ("true", "1", "yes")
+        paper_mode = env.get("PAPER_TRADING", "false").lower() in ("true", "1", "yes")
         
         # Required fields (only in real trading mode)
-        private_key = os.getenv("POLYGON_PRIVATE_KEY", "").strip()
-        funder_address = os.getenv("FUNDER_ADDRESS", "").strip()
+        private_key = env.get("POLYGON_PRIVATE_KEY", "").strip()
+        funder_address = env.get("FUNDER_ADDRESS", "").strip()
         
         # In paper mode, use dummy values if not provided
         if paper_mode:
@@ -95,28 +100,30 @@ class Config:
             funder_address = f"0x{funder_address}"
         
         # Parse trade assets
-        assets_str = os.getenv("TRADE_ASSETS", "BTC,ETH")
+        assets_str = env.get("TRADE_ASSETS", "BTC,ETH")
         trade_assets = [a.strip().upper() for a in assets_str.split(",")]
         
         return cls(
             private_key=private_key,
             funder_address=funder_address,
-            signature_type=int(os.getenv("SIGNATURE_TYPE", "1")),
-            bet_amount_usdc=float(os.getenv("BET_AMOUNT_USDC", "10")),
-            zscore_threshold=float(os.getenv("ZSCORE_THRESHOLD", "2.5")),
-            pct_move_threshold=float(os.getenv("PCT_MOVE_THRESHOLD", "0.5")),
-            lookback_window=int(os.getenv("LOOKBACK_WINDOW", "60")),
-            min_time_to_expiry=int(os.getenv("MIN_TIME_TO_EXPIRY", "300")),
-            max_time_to_expiry=int(os.getenv("MAX_TIME_TO_EXPIRY", "840")),
+            signature_type=int(env.get("SIGNATURE_TYPE", "1")),
+            cache_api_creds=env.get("CACHE_API_CREDS", "true").lower() in ("true", "1", "yes"),
+            bet_amount_usdc=float(env.get("BET_AMOUNT_USDC", "10")),
+            zscore_threshold=float(env.get("ZSCORE_THRESHOLD", "2.5")),
+            pct_move_threshold=float(env.get("PCT_MOVE_THRESHOLD", "0.5")),
+            lookback_window=int(env.get("LOOKBACK_WINDOW", "60")),
+            min_time_to_expiry=int(env.get("MIN_TIME_TO_EXPIRY", "300")),
+            max_time_to_expiry=int(env.get("MAX_TIME_TO_EXPIRY", "840")),
             trade_assets=trade_assets,
-            max_positions=int(os.getenv("MAX_POSITIONS", "2")),
-            exit_zscore_threshold=float(os.getenv("EXIT_ZSCORE_THRESHOLD", "0.5")),
-            force_exit_before_expiry=int(os.getenv("FORCE_EXIT_BEFORE_EXPIRY", "120")),
-            min_seconds_to_expiry_kill_zone=int(os.getenv("MIN_SECONDS_TO_EXPIRY_KILL_ZONE", "300")),
-            log_level=os.getenv("LOG_LEVEL", "INFO").upper(),
-            log_file=os.getenv("LOG_FILE", "bot.log"),
-            log_max_bytes=int(os.getenv("LOG_MAX_BYTES", "10000000")),
-            log_backup_count=int(os.getenv("LOG_BACKUP_COUNT", "5")),
+            max_positions=int(env.get("MAX_POSITIONS", "2")),
+            max_concurrent_orders=int(env.get("MAX_CONCURRENT_ORDERS", "2")),
+            exit_zscore_threshold=float(env.get("EXIT_ZSCORE_THRESHOLD", "0.5")),
+            force_exit_before_expiry=int(env.get("FORCE_EXIT_BEFORE_EXPIRY", "120")),
+            min_seconds_to_expiry_kill_zone=int(env.get("MIN_SECONDS_TO_EXPIRY_KILL_ZONE", "300")),
+            log_level=env.get("LOG_LEVEL", "INFO").upper(),
+            log_file=env.get("LOG_FILE", "bot.log"),
+            log_max_bytes=int(env.get("LOG_MAX_BYTES", "10000000")),
+            log_backup_count=int(env.get("LOG_BACKUP_COUNT", "5")),
         )
     
     def validate(self) -> None:
@@ -141,6 +148,9 @@ class Config:
         if self.zscore_threshold <= 0:
             raise ValueError("ZSCORE_THRESHOLD must be positive")
         
+        if self.max_concurrent_orders < 1:
+            raise ValueError("MAX_CONCURRENT_ORDERS must be at least 1")
+        
         valid_assets = {"BTC", "ETH"}
         for asset in self.trade_assets:
             if asset not in valid_assets:
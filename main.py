@@ -21,20 +21,32 @@ License: MIT
 """
 
 import asyncio
+import atexit
 import logging
 import logging.handlers
+import os
+import queue
 import random
 import signal
 import sys
-from datetime import datetime, timezone
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+import numpy as np
+
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
+
 from config import Config
+from book_feed import BookFeed
 from market_discovery import MarketDiscovery, Market
-from price_feed import PriceFeed
+from price_feed import PriceFeed, PriceWindow
 from volatility import VolatilityDetector, Signal
-from trading import TradingEngine
-from positions import PositionManager
+from trading import TradingEngine, clear_client_cache
+from positions import PositionManager, ExitReason
 from paper_trading import PaperTradingEngine, PaperPositionManager
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -45,14 +57,20 @@ def setup_logging(config: Config) -> logging.Logger:
     """
     Configure logging with file rotation and console output.
     
+    Records are handed to a queue on the calling thread; a background
+    QueueListener thread does the formatting and file/console I/O, so
+    disk writes never block the event loop. The listener is stopped
+    (flushing pending records) at interpreter exit.
+    
     Args:
         config: Application configuration
         
     Returns:
         Root logger instance
     """
+    level = getattr(logging, config.log_level)
     logger = logging.getLogger()
-    logger.setLevel(getattr(logging, config.log_level))
+    logger.setLevel(level)
     
     # Clear existing handlers
     logger.handlers.clear()
@@ -72,13 +90,24 @@ def setup_logging(config: Config) -> logging.Logger:
     )
     file_handler.setFormatter(formatter)
     file_handler.setLevel(logging.DEBUG)  # Log everything to file
-    logger.addHandler(file_handler)
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    console_handler.setLevel(getattr(logging, config.log_level))
-    logger.addHandler(console_handler)
+    console_handler.setLevel(level)
+    
+    # Only the queue handler runs on the caller's thread
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        file_handler,
+        console_handler,
+        respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
     
     return logger
 
@@ -92,6 +121,8 @@ class ExponentialBackoff:
     Exponential backoff with jitter for resilient reconnection.
     """
     
+    __slots__ = ('base', 'max_delay', 'multiplier', '_current', '_attempts', '_rng')
+    
     def __init__(
         self,
         base: float = 1.0,
@@ -103,6 +134,7 @@ class ExponentialBackoff:
         self.multiplier = multiplier
         self._current = base
         self._attempts = 0
+        self._rng = random.Random()  # Private PRNG, no shared module state
     
     def next(self) -> float:
         """Get next backoff delay with jitter."""
@@ -110,8 +142,7 @@ class ExponentialBackoff:
         self._current = min(self._current * self.multiplier, self.max_delay)
         self._attempts += 1
         # Add jitter (±10%)
-        jitter = delay * 0.1 * (random.random() * 2 - 1)
-        return delay + jitter
+        return delay + delay * self._rng.uniform(-0.1, 0.1)
     
     def reset(self) -> None:
         """Reset backoff to initial state."""
@@ -134,44 +165,92 @@ class PolyGraalX:
     Coordinates all components and manages the main trading loop.
     """
     
+    __slots__ = (
+        'config', 'logger', 'bet_mode', 'bet_value',
+        '_assets', '_asset_pairs',
+        'price_feed', 'book_feed', 'market_discovery', 'volatility', 'trading', 'positions',
+        '_stop_event', '_running', '_orders_in_flight', '_order_sem',
+        '_clob_pool', '_tick_markets', '_last_no_market_log',
+    )
+    
     def __init__(self, config: Config, bet_mode: str = "fixed", bet_value: float = 2.0):
         self.config = config
-        self.logger = logging.getLogger("PolyGraalX")
+        self.logger = self._build_logger()
         
         # Bet sizing strategy
         self.bet_mode = bet_mode  # "fixed" or "percentage"
         self.bet_value = bet_value  # Either fixed amount or percentage
         
+        # Traded assets and their Binance symbols, fixed for the bot's lifetime
+        self._assets = tuple(config.trade_assets)
+        self._asset_pairs = tuple((asset, f"{asset}/USDT") for asset in self._assets)
+        
         # Components
-        self.price_feed = PriceFeed(
-            symbols=[f"{asset}/USDT" for asset in config.trade_assets],
-            window_seconds=config.lookback_window
-        )
+        self.price_feed = self._build_price_feed()
+        self.book_feed = self._build_book_feed()
+        self.market_discovery = self._build_market_discovery()
+        self.volatility = self._build_volatility()
+        self.trading = self._build_trading()
+        self.trading.book_feed = self.book_feed
+        self.positions = self._build_positions()
         
-        self.market_discovery = MarketDiscovery(
-            min_time_to_expiry=config.min_time_to_expiry,
-            max_time_to_expiry=config.max_time_to_expiry,
+        # Control
+        self._stop_event = asyncio.Event()
+        self._running = False
+        self._orders_in_flight: set[str] = set()
+        self._order_sem = asyncio.Semaphore(config.max_concurrent_orders)
+        self._clob_pool = self._build_clob_pool()
+        self.positions.executor = self._clob_pool
+        self._tick_markets: dict[str, Optional[Market]] = {}  # Snapshot for one signal-loop tick
+        self._last_no_market_log: dict[str, float] = {}  # asset -> last warning time
+    
+    # ══════════════════════════════════════════════════════════════════════════
+    # COMPONENT FACTORIES (overridden by PaperPolyGraalX)
+    # ══════════════════════════════════════════════════════════════════════════
+    
+    def _build_logger(self) -> logging.Logger:
+        return logging.getLogger("PolyGraalX")
+    
+    def _build_price_feed(self) -> PriceFeed:
+        return PriceFeed(
+            symbols=[symbol for _, symbol in self._asset_pairs],
+            window_seconds=self.config.lookback_window
+        )
+    
+    def _build_book_feed(self) -> Optional[BookFeed]:
+        return BookFeed()
+    
+    def _build_market_discovery(self) -> MarketDiscovery:
+        return MarketDiscovery(
+            min_time_to_expiry=self.config.min_time_to_expiry,
+            max_time_to_expiry=self.config.max_time_to_expiry,
             scan_interval=30
         )
-        
-        self.volatility = VolatilityDetector(
-            zscore_threshold=config.zscore_threshold,
-            pct_threshold=config.pct_move_threshold,
-            exit_zscore=config.exit_zscore_threshold
+    
+    def _build_volatility(self) -> VolatilityDetector:
+        return VolatilityDetector(
+            zscore_threshold=self.config.zscore_threshold,
+            pct_threshold=self.config.pct_move_threshold,
+            exit_zscore=self.config.exit_zscore_threshold
         )
-        
-        self.trading = TradingEngine(config)
-        
-        self.positions = PositionManager(
+    
+    def _build_trading(self) -> TradingEngine:
+        return TradingEngine(self.config)
+    
+    def _build_clob_pool(self) -> ThreadPoolExecutor:
+        # Blocking CLOB calls run here, capped at the order concurrency limit
+        return ThreadPoolExecutor(
+            max_workers=self.config.max_concurrent_orders,
+            thread_name_prefix="clob"
+        )
+    
+    def _build_positions(self) -> PositionManager:
+        return PositionManager(
             trading_engine=self.trading,
-            max_positions=config.max_positions,
-            exit_zscore_threshold=config.exit_zscore_threshold,
-            force_exit_before_expiry=config.force_exit_before_expiry
+            max_positions=self.config.max_positions,
+            exit_zscore_threshold=self.config.exit_zscore_threshold,
+            force_exit_before_expiry=self.config.force_exit_before_expiry
         )
-        
-        # Control
-        self._stop_event = asyncio.Event()
-        self._running = False
     
     def get_bet_amount(self, current_balance: float = None) -> float:
         """
@@ -195,84 +274,171 @@ class PolyGraalX:
     
     def _get_zscore(self, asset: str) -> float:
         """Get current Z-Score for an asset."""
-        window = self.price_feed.get_window(asset)
+        return self._zscore_from_window(self.price_feed.get_window(asset))
+    
+    def _get_zscores(self, assets: np.ndarray) -> np.ndarray:
+        """Get current Z-Scores for an array of assets (batch exit evaluation)."""
+        return np.fromiter(
+            (self._get_zscore(asset) for asset in assets),
+            dtype=np.float64,
+            count=len(assets)
+        )
+    
+    def _zscore_from_window(self, window: Optional[PriceWindow]) -> float:
+        """Get current Z-Score from an already-fetched price window."""
         if not window or not window.is_ready():
             return 0.0
         
-        return self.volatility.calculate_zscore(
-            window.get_prices(),
-            window.current_price
+        # O(1): uses the window's running moments, no pass over the prices
+        return self.volatility.zscore_from_stats(
+            window.current_price,
+            window.mean,
+            window.std
         )
     
     async def _check_entry_signals(self) -> None:
-        """Check for entry signals on all assets."""
-        for asset in self.config.trade_assets:
-            try:
-                # Skip if we can't open more positions
-                if not self.positions.can_open_position(asset):
-                    continue
-                
-                # Get market
-                market = self.market_discovery.get_cached_market(asset)
-                if not market or not market.is_tradeable:
-                    # Only log once per minute to avoid spam
-                    if not hasattr(self, '_last_no_market_log'):
-                        self._last_no_market_log = {}
-                    
-                    import time
-                    now = time.time()
-                    if asset not in self._last_no_market_log or (now - self._last_no_market_log.get(asset, 0)) > 60:
-                        self.logger.warning(f"⚠️ No tradeable market found for {asset} - skipping entry check")
-                        self.logger.info(f"💡 Market discovery may be failing due to Gamma API connection issues")
-                        self._last_no_market_log[asset] = now
-                    continue
-                
-                # 🔴 KILL ZONE CHECK: Do NOT trade if too close to expiry
-                seconds_to_expiry = market.seconds_to_expiry
-                if seconds_to_expiry < self.config.min_seconds_to_expiry_kill_zone:
-                    self.logger.info(
-                        f"⏱️ KILL ZONE: Skipping {asset} - Too close to expiry "
-                        f"({seconds_to_expiry}s < {self.config.min_seconds_to_expiry_kill_zone}s minimum)"
-                    )
-                    continue
-                
-                # Get price data
-                window = self.price_feed.get_window(asset)
-                if not window or not window.is_ready():
-                    continue
-                
-                # Check for signal
-                signal = self.volatility.check_entry_signal(
-                    asset=asset,
-                    prices=window.get_prices(),
-                    current_price=window.current_price
-                )
-                
-                if signal:
-                    self.logger.info(f"🎯 SIGNAL DETECTED: {signal}")
-                    
-                    # Calculate bet amount dynamically
-                    bet_amount = self.get_bet_amount()
-                    
-                    # Execute trade
-                    result = self.trading.place_market_order(
-                        market=market,
-                        direction=signal.direction,
-                        amount_usdc=bet_amount
+        """Check for entry signals on all assets and submit the resulting orders."""
+        assets = self._assets
+        results = await asyncio.gather(
+            *(self._check_asset(asset) for asset in assets),
+            return_exceptions=True
+        )
+        
+        pending = []
+        for asset, result in zip(assets, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error checking signals for {asset}: {result}")
+            elif result is not None:
+                pending.append(result)
+        
+        if pending:
+            await self._submit_orders(pending)
+    
+    async def _submit_orders(self, pending: list[tuple[Market, Signal, float]]) -> None:
+        """
+        Submit this tick's orders, batching them into one CLOB request.
+        
+        Args:
+            pending: (market, signal, bet_amount) tuples reserved by _check_asset
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            # Execute off the event loop (CLOB client is blocking HTTP)
+            async with self._order_sem:
+                if len(pending) == 1:
+                    market, signal, bet_amount = pending[0]
+                    results = [await loop.run_in_executor(
+                        self._clob_pool,
+                        self.trading.place_market_order,
+                        market,
+                        signal.direction,
+                        bet_amount
+                    )]
+                else:
+                    results = await loop.run_in_executor(
+                        self._clob_pool,
+                        self.trading.place_market_orders_batch,
+                        [(market, signal.direction, amount) for market, signal, amount in pending]
                     )
-                    
-                    if result.success:
-                        self.positions.open_position(market, signal, result)
-                        self.logger.info(f"✅ Trade executed: {signal.direction} on {asset}")
-                    else:
-                        self.logger.error(f"❌ Trade failed: {result.error}")
-                        
-            except Exception as e:
-                self.logger.error(f"Error checking signals for {asset}: {e}")
+        finally:
+            for market, _, _ in pending:
+                self._orders_in_flight.discard(market.asset)
+        
+        for (market, signal, _), result in zip(pending, results):
+            if result.success:
+                self.positions.open_position(market, signal, result)
+                self.logger.info(f"✅ Trade executed: {signal.direction} on {market.asset}")
+            else:
+                self.logger.error(f"❌ Trade failed: {result.error}")
+            self.trading.recycle(result)
+    
+    def _market_for(self, asset: str) -> Optional[Market]:
+        """Get the tradeable market for an asset, from this tick's snapshot if taken."""
+        if asset in self._tick_markets:
+            return self._tick_markets[asset]
+        return self.market_discovery.get_cached_market(asset)
+    
+    def _watch_books(self) -> None:
+        """Stream order books for this tick's markets and every open position."""
+        tokens = {position.token_id for position in self.positions.open_positions}
+        for market in self._tick_markets.values():
+            if market is not None:
+                tokens.add(market.token_id_yes)
+                tokens.add(market.token_id_no)
+        self.book_feed.watch(tokens)
+    
+    def _has_capacity(self, asset: str) -> bool:
+        """Check position limits, counting orders still in flight."""
+        if asset in self._orders_in_flight:
+            return False
+        if not self.positions.can_open_position(asset):
+            return False
+        in_use = self.positions.position_count + len(self._orders_in_flight)
+        return in_use < self.positions.max_positions
+    
+    async def _check_asset(self, asset: str) -> Optional[tuple[Market, Signal, float]]:
+        """
+        Check for an entry signal on one asset.
+        
+        Returns:
+            (market, signal, bet_amount) with a position slot reserved for the
+            asset, or None if there is nothing to trade
+        """
+        # Skip if we can't open more positions
+        if not self._has_capacity(asset):
+            return None
+        
+        # Get market
+        market = self._market_for(asset)
+        if not market or not market.is_tradeable:
+            # Only log once per minute to avoid spam
+            import time
+            now = time.time()
+            if asset not in self._last_no_market_log or (now - self._last_no_market_log.get(asset, 0)) > 60:
+                self.logger.warning(f"⚠️ No tradeable market found for {asset} - skipping entry check")
+                self.logger.info(f"💡 Market discovery may be failing due to Gamma API connection issues")
+                self._last_no_market_log[asset] = now
+            return None
+        
+        # 🔴 KILL ZONE CHECK: Do NOT trade if too close to expiry
+        seconds_to_expiry = market.seconds_to_expiry
+        if seconds_to_expiry < self.config.min_seconds_to_expiry_kill_zone:
+            self.logger.info(
+                f"⏱️ KILL ZONE: Skipping {asset} - Too close to expiry "
+                f"({seconds_to_expiry}s < {self.config.min_seconds_to_expiry_kill_zone}s minimum)"
+            )
+            return None
+        
+        # Get price data
+        window = self.price_feed.get_window(asset)
+        if not window or not window.is_ready():
+            return None
+        
+        # Check for signal
+        signal = self.volatility.check_entry_signal(
+            asset=asset,
+            prices=window.get_prices(),
+            current_price=window.current_price
+        )
+        
+        if not signal:
+            return None
+        
+        self.logger.info(f"🎯 SIGNAL DETECTED: {signal}")
+        
+        # Re-check: a sibling asset may have claimed the last slot meanwhile
+        if not self._has_capacity(asset):
+            return None
+        
+        # Reserve the slot until the order is resolved in _submit_orders
+        self._orders_in_flight.add(asset)
+        
+        # Calculate bet amount dynamically
+        return market, signal, self.get_bet_amount()
     
     async def _check_exit_conditions(self) -> None:
         """Check and process exits for open positions."""
-        closed = await self.positions.process_exits(self._get_zscore)
+        closed = await self.positions.process_exits(self._get_zscores)
         
         for position, reason, result in closed:
             if result and result.success:
@@ -283,25 +449,29 @@ class PolyGraalX:
                 self.logger.error(
                     f"❌ Failed to close position: {position.position_id}"
                 )
+            if result:
+                self.trading.recycle(result)
     
     async def _log_status(self) -> None:
         """Log current bot status."""
+        # Skip building the status line entirely when INFO is filtered out
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         status_lines = []
         
-        # Price feed status
-        for asset in self.config.trade_assets:
+        # Price feed and market status, one pass per asset
+        for asset in self._assets:
             window = self.price_feed.get_window(asset)
             if window and window.current_price > 0:
-                zscore = self._get_zscore(asset)
+                zscore = self._zscore_from_window(window)
                 status_lines.append(
                     f"{asset}: ${window.current_price:,.2f} (Z={zscore:+.2f}, samples={window.sample_count})"
                 )
             else:
                 status_lines.append(f"{asset}: No data")
-        
-        # Market status
-        for asset in self.config.trade_assets:
-            market = self.market_discovery.get_cached_market(asset)
+            
+            market = self._market_for(asset)
             if market:
                 status_lines.append(
                     f"Market {asset}: {market.question[:50]}... ({market.seconds_to_expiry}s to expiry)"
@@ -319,11 +489,21 @@ class PolyGraalX:
         """Main signal processing loop."""
         self.logger.info("Starting signal processing loop...")
         
-        last_status_log = datetime.now(timezone.utc)
+        loop = asyncio.get_running_loop()
         status_interval = 30  # Log status every 30 seconds
+        next_status_at = loop.time() + status_interval
         
         while not self._stop_event.is_set():
             try:
+                # Snapshot cached markets once for everything in this tick
+                now_ts = time.time()
+                self._tick_markets = {
+                    asset: self.market_discovery.get_cached_market(asset, now_ts)
+                    for asset in self._assets
+                }
+                if self.book_feed is not None:
+                    self._watch_books()
+                
                 # Check for entry signals
                 await self._check_entry_signals()
                 
@@ -340,18 +520,28 @@ class PolyGraalX:
                     self.stop()
                     break
                 
-                # Periodic status log
-                now = datetime.now(timezone.utc)
-                if (now - last_status_log).seconds >= status_interval:
+                # Periodic status log (monotonic clock, immune to wall-clock jumps)
+                now = loop.time()
+                if now >= next_status_at:
                     await self._log_status()
-                    last_status_log = now
+                    next_status_at = now + status_interval
+                
+                self._tick_markets.clear()
                 
-                await asyncio.sleep(1)
+                # Tick every second, but wake immediately on stop
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=1.0)
+                    break
+                except asyncio.TimeoutError:
+                    pass
                 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                self.logger.error(f"Signal loop error: {e}", exc_info=True)
+                self._tick_markets.clear()
+                # Traceback only at DEBUG: this path can fire every few seconds
+                self.logger.error("Signal loop error: %r", e)
+                self.logger.debug("Signal loop traceback:", exc_info=True)
                 await asyncio.sleep(5)
     
     async def run(self) -> None:
@@ -367,9 +557,11 @@ class PolyGraalX:
         self.logger.info(f"Z-Score Threshold: ±{self.config.zscore_threshold}")
         self.logger.info("=" * 60)
         
-        # Test CLOB connection
+        # Test CLOB connection; rejected credentials (401/403) propagate so
+        # main() can rebuild the client with fresh ones
         self.logger.info("Testing Polymarket CLOB connection...")
-        if not self.trading.test_connection():
+        loop = asyncio.get_running_loop()
+        if not await loop.run_in_executor(self._clob_pool, self.trading.test_connection):
             self.logger.error("Failed to connect to Polymarket CLOB. Check your credentials.")
             return
         
@@ -377,8 +569,9 @@ class PolyGraalX:
             # Run all components concurrently
             await asyncio.gather(
                 self.price_feed.stream(self._stop_event),
+                self.book_feed.stream(self._stop_event),
                 self.market_discovery.scan_loop(
-                    self.config.trade_assets,
+                    list(self._assets),
                     self._stop_event
                 ),
                 self._signal_loop()
@@ -391,24 +584,47 @@ class PolyGraalX:
         """Clean up resources on shutdown."""
         self.logger.info("Shutting down...")
         
-        # Close open positions
+        # Close open positions (one batched sell) and cancel open orders.
+        # The two requests are independent, so run them concurrently on the
+        # CLOB pool: shutdown waits for the slower one, not for both.
         for position in self.positions.open_positions:
             self.logger.warning(f"Closing position on shutdown: {position}")
-            from positions import ExitReason
-            self.positions.close_position(
-                position,
-                ExitReason(code="shutdown", description="Bot shutdown")
-            )
-        
-        # Cancel open orders
-        self.trading.cancel_all_orders()
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            self.positions.close_all(ExitReason(code="shutdown", description="Bot shutdown")),
+            loop.run_in_executor(self._clob_pool, self.trading.cancel_all_orders)
+        )
+        self._clob_pool.shutdown(wait=False, cancel_futures=True)
         
         # Close connections
         await self.price_feed.close()
+        await self.book_feed.close()
         await self.market_discovery.close()
         
         self.logger.info("Shutdown complete")
     
+    async def reset(self) -> None:
+        """
+        Prepare the bot for a restart after a transient failure.
+        
+        Rebuilds only the network-facing feeds (fresh WebSocket and Gamma
+        session, empty price windows). The trading engine, its authenticated
+        CLOB client and position manager are kept, so a restart does not
+        redo API credential derivation.
+        """
+        await self.price_feed.close()
+        await self.market_discovery.close()
+        
+        self.price_feed = self._build_price_feed()
+        self.book_feed = self._build_book_feed()
+        self.trading.book_feed = self.book_feed
+        self.market_discovery = self._build_market_discovery()
+        
+        # _cleanup() shut the previous pool down
+        self._clob_pool = self._build_clob_pool()
+        self.positions.executor = self._clob_pool
+        self._orders_in_flight.clear()
+    
     def stop(self) -> None:
         """Signal the bot to stop."""
         self.logger.info("Stop signal received")
@@ -422,47 +638,31 @@ class PaperPolyGraalX(PolyGraalX):
     Uses simulated trading engine with fictional balance.
     """
     
+    __slots__ = ('initial_balance',)
+    
     def __init__(self, config: Config, initial_balance: float = 10.0, bet_mode: str = "fixed", bet_value: float = 2.0):
-        # Initialize parent components except trading/positions
-        self.config = config
-        self.logger = logging.getLogger("PolyGraalX-Paper")
+        # Needed by _build_trading during the parent constructor
         self.initial_balance = initial_balance
-        
-        # Bet sizing strategy
-        self.bet_mode = bet_mode
-        self.bet_value = bet_value
-        
-        # Components
-        self.price_feed = PriceFeed(
-            symbols=[f"{asset}/USDT" for asset in config.trade_assets],
-            window_seconds=config.lookback_window
-        )
-        
-        self.market_discovery = MarketDiscovery(
-            min_time_to_expiry=config.min_time_to_expiry,
-            max_time_to_expiry=config.max_time_to_expiry,
-            scan_interval=30
-        )
-        
-        self.volatility = VolatilityDetector(
-            zscore_threshold=config.zscore_threshold,
-            pct_threshold=config.pct_move_threshold,
-            exit_zscore=config.exit_zscore_threshold
-        )
-        
+        super().__init__(config, bet_mode=bet_mode, bet_value=bet_value)
+    
+    def _build_logger(self) -> logging.Logger:
+        return logging.getLogger("PolyGraalX-Paper")
+    
+    def _build_trading(self) -> PaperTradingEngine:
         # Paper trading engine instead of real one
-        self.trading = PaperTradingEngine(initial_balance=initial_balance)
-        
-        self.positions = PaperPositionManager(
+        return PaperTradingEngine(initial_balance=self.initial_balance)
+    
+    def _build_book_feed(self) -> None:
+        # Paper fills are simulated; no order book stream needed
+        return None
+    
+    def _build_positions(self) -> PaperPositionManager:
+        return PaperPositionManager(
             trading_engine=self.trading,
-            max_positions=config.max_positions,
-            exit_zscore_threshold=config.exit_zscore_threshold,
-            force_exit_before_expiry=config.force_exit_before_expiry
+            max_positions=self.config.max_positions,
+            exit_zscore_threshold=self.config.exit_zscore_threshold,
+            force_exit_before_expiry=self.config.force_exit_before_expiry
         )
-        
-        # Control
-        self._stop_event = asyncio.Event()
-        self._running = False
     
     def get_bet_amount(self, current_balance: float = None) -> float:
         """
@@ -509,7 +709,7 @@ class PaperPolyGraalX(PolyGraalX):
             await asyncio.gather(
                 self.price_feed.stream(self._stop_event),
                 self.market_discovery.scan_loop(
-                    self.config.trade_assets,
+                    list(self._assets),
                     self._stop_event
                 ),
                 self._signal_loop(),
@@ -521,16 +721,21 @@ class PaperPolyGraalX(PolyGraalX):
     
     async def _check_exit_conditions(self) -> None:
         """Check and process exits for paper positions."""
-        closed = await self.positions.process_exits(self._get_zscore)
+        closed = await self.positions.process_exits(self._get_zscores)
         
         for position, reason, result in closed:
             if result and result.success:
                 self.logger.info(
                     f"✅ Paper position closed: {position.asset} {position.direction} - {reason}"
                 )
+            if result:
+                self.trading.recycle(result)
     
     async def _log_status(self) -> None:
         """Log current paper trading status."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         # Get trading statistics
         stats = self.trading.get_statistics()
         pos_status = self.positions.get_status()
@@ -559,10 +764,10 @@ class PaperPolyGraalX(PolyGraalX):
             )
         
         # Price feed status
-        for asset in self.config.trade_assets:
+        for asset in self._assets:
             window = self.price_feed.get_window(asset)
             if window and window.current_price > 0:
-                zscore = self._get_zscore(asset)
+                zscore = self._zscore_from_window(window)
                 status_lines.append(
                     f"{asset}: ${window.current_price:,.2f} (Z={zscore:+.2f})"
                 )
@@ -585,6 +790,8 @@ class PaperPolyGraalX(PolyGraalX):
         # Print session summary
         self.trading.print_summary()
         
+        self._clob_pool.shutdown(wait=False, cancel_futures=True)
+        
         # Close connections
         await self.price_feed.close()
         await self.market_discovery.close()
@@ -596,6 +803,39 @@ class PaperPolyGraalX(PolyGraalX):
 # MAIN ENTRY POINT
 # ══════════════════════════════════════════════════════════════════════════════
 
+def _kernel_version() -> tuple[int, ...]:
+    """Parse the running Linux kernel release (e.g. "6.8.0-45-generic" -> (6, 8))."""
+    parts = []
+    for part in os.uname().release.split("-")[0].split(".")[:2]:
+        if not part.isdigit():
+            break
+        parts.append(int(part))
+    return tuple(parts)
+
+
+def install_event_loop_policy() -> None:
+    """
+    Select the event loop implementation before asyncio.run().
+    
+    USE_IO_URING=1 (read from the process environment, e.g. the systemd unit)
+    opts into the io_uring-backed rloop on Linux 5.11+. Otherwise uvloop is used
+    when installed, falling back to the default asyncio loop.
+    """
+    use_io_uring = os.getenv("USE_IO_URING", "false").lower() in ("true", "1", "yes")
+    
+    if use_io_uring and sys.platform == "linux" and _kernel_version() >= (5, 11):
+        try:
+            import rloop
+            asyncio.set_event_loop_policy(rloop.EventLoopPolicy())
+            return
+        except ImportError:
+            print("⚠️ USE_IO_URING set but rloop is not installed, falling back")
+    
+    # libuv-backed loop: cheaper WebSocket frame dispatch than the selector loop
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def display_menu() -> int:
     """Display interactive mode selection menu.
     
@@ -684,8 +924,6 @@ def display_bet_menu() -> tuple[str, float]:
 
 async def main() -> None:
     """Main entry point with interactive mode selection."""
-    import os
-    
     # Display interactive menu
     mode_choice = display_menu()
     paper_mode = (mode_choice == 1)
@@ -758,8 +996,12 @@ async def main() -> None:
     # Setup signal handlers for graceful shutdown
     loop = asyncio.get_running_loop()
     
+    # Process-wide shutdown flag, independent of which bot instance is live
+    shutdown_event = asyncio.Event()
+    
     def signal_handler(sig):
         logger.info(f"Received signal {sig}")
+        shutdown_event.set()
         bot.stop()
     
     for sig in (signal.SIGINT, signal.SIGTERM):
@@ -772,7 +1014,7 @@ async def main() -> None:
     # Main loop with exponential backoff
     backoff = ExponentialBackoff(base=1, max_delay=60)
     
-    while True:
+    while not shutdown_event.is_set():
         try:
             await bot.run()
             break  # Clean exit
@@ -783,28 +1025,45 @@ async def main() -> None:
             break
             
         except Exception as e:
-            logger.error(f"Critical error: {e}", exc_info=True)
+            logger.error("Critical error: %r", e)
+            logger.debug("Critical error traceback:", exc_info=True)
             
             delay = backoff.next()
             logger.warning(
                 f"Restarting in {delay:.1f}s (attempt {backoff.attempts})..."
             )
             
+            # Sleep out the backoff, but give up restarting on shutdown
             try:
-                await asyncio.sleep(delay)
+                await asyncio.wait_for(shutdown_event.wait(), timeout=delay)
+                break
+            except asyncio.TimeoutError:
+                pass
             except asyncio.CancelledError:
                 break
             
-            # Recreate bot for clean restart
-            if paper_mode:
-                bot = PaperPolyGraalX(config, initial_balance=paper_balance)
+            # Rejected credentials need a fresh CLOB client; anything else
+            # only needs the feeds reconnected
+            if getattr(e, "status_code", None) in (401, 403):
+                if paper_mode:
+                    bot = PaperPolyGraalX(
+                        config,
+                        initial_balance=paper_balance,
+                        bet_mode=bet_mode,
+                        bet_value=bet_value
+                    )
+                else:
+                    clear_client_cache()
+                    bot = PolyGraalX(config, bet_mode=bet_mode, bet_value=bet_value)
             else:
-                bot = PolyGraalX(config)
+                await bot.reset()
     
     logger.info("PolyGraalX terminated")
 
 
 if __name__ == "__main__":
+    install_event_loop_policy()
+    
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -8,20 +8,199 @@ on Polymarket using the Gamma API.
 import asyncio
 import re
 import logging
-from dataclasses import dataclass
+import random
+import ssl
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 import aiohttp
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # Optional dependency: fall back to the stdlib parser
+    from json import loads as _json_loads
+
+try:
+    import ijson
+except ImportError:  # Optional dependency: parse the whole body at once
+    ijson = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # Optional dependency: fall back to the stdlib parser
+    def _parse_iso(value: str) -> datetime:
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+
 logger = logging.getLogger(__name__)
 
 # Gamma API Configuration
 GAMMA_API_BASE = "https://gamma-api.polymarket.com"
 CRYPTO_TAG_ID = 102467  # Polymarket's 15-minute crypto markets tag
+MAX_RETRY_DELAY = 30.0  # Cap on jittered retry backoff (seconds)
+
+# Circuit breaker around the Gamma API
+BREAKER_CLOSED = "closed"        # Normal operation
+BREAKER_OPEN = "open"            # Fetches short-circuit to []
+BREAKER_HALF_OPEN = "half_open"  # One probe request allowed
+BREAKER_FAILURE_THRESHOLD = 2    # Consecutive failed fetches before opening
+BREAKER_COOLDOWN = 300.0         # Seconds to stay open before probing
+
+MARKET_CACHE_TTL = 300.0  # Max seconds to serve a market without refetching
+
+# Market text patterns, compiled once at import
+_RE_PARSE = re.compile(
+    r"\b(?P<asset>btc|bitcoin|eth|ethereum)\b"
+    r"(?:.*?\$(?P<strike>\d[\d,]*)(?:\.(?P<frac>\d+))?)?",
+    re.IGNORECASE | re.DOTALL
+)
+_RE_15MIN = re.compile(r"15[\s-]?min|15m\b|fifteen[\s-]minute", re.IGNORECASE)
+
+# Strike forms, as (whole, fraction) group pairs: "$95,000", "95,000", "above 95000"
+_RE_STRIKE = re.compile(
+    r"\$(\d[\d,]*)(?:\.(\d+))?"
+    r"|(\d{1,3}(?:,\d{3})+)(?:\.(\d+))?"
+    r"|above\s+(\d+(?:,\d+)*)(?:\.(\d+))?"
+)
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with up to 50% jitter, capped at MAX_RETRY_DELAY."""
+    return min(MAX_RETRY_DELAY, (2 ** attempt) * (1 + random.random() * 0.5))
+
+
+def _strike_value(whole: str, fraction: Optional[str]) -> float:
+    """Convert matched strike digits, staying integral when there is no fraction."""
+    digits = whole.replace(",", "")
+    return float(f"{digits}.{fraction}") if fraction else int(digits)
+
+
+def _is_candidate(market_data: Any) -> bool:
+    """Cheap text pre-filter: a BTC/ETH question with a 15-minute marker."""
+    if not isinstance(market_data, dict):
+        return False
+    question = market_data.get("question") or ""
+    slug = market_data.get("slug") or ""
+    return bool(_RE_PARSE.search(question)) and bool(
+        _RE_15MIN.search(question) or _RE_15MIN.search(slug)
+    )
+
+
+# Outcome names mapped to our YES/NO sides (15-min markets use Up/Down)
+_YES_OUTCOMES = frozenset(("YES", "UP"))
+_NO_OUTCOMES = frozenset(("NO", "DOWN"))
+
+TokenPair = Tuple[Optional[str], Optional[str]]
+
+
+def _json_list(value: Any) -> list:
+    """Decode a list field that Gamma may send as a JSON-encoded string."""
+    if isinstance(value, str):
+        try:
+            value = _json_loads(value)
+        except ValueError:
+            return []
+    return value if isinstance(value, list) else []
+
+
+def _pair_by_outcome(entries: list, name_keys: Tuple[str, ...]) -> TokenPair:
+    """Pick YES/NO token IDs out of a list of {outcome, token_id} dicts."""
+    token_yes = token_no = None
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        name = next((str(entry[k]).upper() for k in name_keys if entry.get(k)), "")
+        token_id = entry.get("token_id") or entry.get("tokenId")
+        if name in _YES_OUTCOMES:
+            token_yes = token_id
+        elif name in _NO_OUTCOMES:
+            token_no = token_id
+    return token_yes, token_no
+
+
+def _tokens_from_array(market_data: Dict[str, Any]) -> TokenPair:
+    tokens = market_data["tokens"]
+    if not isinstance(tokens, list) or len(tokens) < 2:
+        return None, None
+    return _pair_by_outcome(tokens, ("outcome",))
+
+
+def _tokens_from_fields(market_data: Dict[str, Any]) -> TokenPair:
+    return market_data.get("token_id_yes"), market_data.get("token_id_no")
+
+
+def _tokens_from_clob_ids(market_data: Dict[str, Any]) -> TokenPair:
+    token_ids = _json_list(market_data["clobTokenIds"])
+    if len(token_ids) < 2:
+        return None, None
+    # clobTokenIds lines up with outcomes; assume [YES, NO] when names are missing
+    names = [str(o).upper() for o in _json_list(market_data.get("outcomes"))]
+    if len(names) != len(token_ids):
+        return token_ids[0], token_ids[1]
+    token_yes = next((t for n, t in zip(names, token_ids) if n in _YES_OUTCOMES), None)
+    token_no = next((t for n, t in zip(names, token_ids) if n in _NO_OUTCOMES), None)
+    return token_yes, token_no
+
+
+def _tokens_from_outcomes(market_data: Dict[str, Any]) -> TokenPair:
+    return _pair_by_outcome(_json_list(market_data["outcomes"]), ("name",))
+
+
+# Token ID layouts, tried in order until both sides resolve: (trigger key, accessor)
+_TOKEN_ACCESSORS = (
+    ("tokens", _tokens_from_array),
+    ("token_id_yes", _tokens_from_fields),
+    ("token_id_no", _tokens_from_fields),
+    ("clobTokenIds", _tokens_from_clob_ids),
+    ("outcomes", _tokens_from_outcomes),
+)
+
+
+# One HTTP session (and connection pool) shared by every MarketDiscovery
+_shared_session: Optional[aiohttp.ClientSession] = None
+_shared_session_lock = asyncio.Lock()
 
 
-@dataclass
+async def get_shared_session() -> aiohttp.ClientSession:
+    """Get or create the shared aiohttp session with SSL verification disabled for problematic networks."""
+    global _shared_session
+    async with _shared_session_lock:
+        if _shared_session is None or _shared_session.closed:
+            timeout = aiohttp.ClientTimeout(total=30, connect=10)
+            
+            # Create SSL context without certificate verification
+            ssl_context = ssl.create_default_context()
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+            
+            connector = aiohttp.TCPConnector(
+                ssl=ssl_context,
+                limit=50,
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True
+            )
+            _shared_session = aiohttp.ClientSession(
+                timeout=timeout,
+                connector=connector
+            )
+        return _shared_session
+
+
+async def close_shared_session() -> None:
+    """Close the shared HTTP session."""
+    global _shared_session
+    async with _shared_session_lock:
+        if _shared_session and not _shared_session.closed:
+            await _shared_session.close()
+        _shared_session = None
+
+
+@dataclass(slots=True, frozen=True)
 class Market:
     """Represents a tradeable Polymarket 15-min market."""
     
@@ -34,12 +213,19 @@ class Market:
     token_id_no: str
     slug: str
     market_id: str
+    end_time_epoch: float = field(init=False, repr=False)  # end_time as a Unix timestamp
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "end_time_epoch", self.end_time.timestamp())
+    
+    def seconds_to_expiry_from(self, now_ts: float) -> int:
+        """Seconds remaining until market closes, relative to a Unix timestamp."""
+        return max(0, int(self.end_time_epoch - now_ts))
     
     @property
     def seconds_to_expiry(self) -> int:
         """Seconds remaining until market closes."""
-        delta = self.end_time - datetime.now(timezone.utc)
-        return max(0, int(delta.total_seconds()))
+        return self.seconds_to_expiry_from(time.time())
     
     @property
     def is_tradeable(self) -> bool:
@@ -60,6 +246,11 @@ class MarketDiscovery:
     - Time window: 5-14 minutes until expiry (tradeable window)
     """
     
+    __slots__ = (
+        'min_time_to_expiry', 'max_time_to_expiry', 'scan_interval',
+        '_markets', '_breaker_state', '_failure_count', '_opened_at', '_inflight',
+    )
+    
     def __init__(
         self,
         min_time_to_expiry: int = 30,    # Accept markets 30s before expiry
@@ -76,44 +267,84 @@ class MarketDiscovery:
         self.max_time_to_expiry = max_time_to_expiry
         self.scan_interval = scan_interval
         
-        # Cached active markets
-        self._markets: Dict[str, Market] = {}  # asset -> Market
-        self._session: Optional[aiohttp.ClientSession] = None
-        # Flag to avoid spamming warnings when API is unreachable
-        self._api_unreachable: bool = False
-        self._last_error_logged: float = 0
+        # Cached active markets: asset -> (market, monotonic refetch deadline)
+        self._markets: Dict[str, Tuple[Market, float]] = {}
+        # Gamma API circuit breaker
+        self._breaker_state: str = BREAKER_CLOSED
+        self._failure_count: int = 0
+        self._opened_at: float = 0.0
+        # Gamma fetch currently in flight, awaited by every concurrent caller
+        self._inflight: Optional[asyncio.Future] = None
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session with SSL verification disabled for problematic networks."""
-        if self._session is None or self._session.closed:
-            import ssl
-            
-            timeout = aiohttp.ClientTimeout(total=30, connect=10)
-            
-            # Create SSL context without certificate verification
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            
-            connector = aiohttp.TCPConnector(ssl=ssl_context)
-            self._session = aiohttp.ClientSession(
-                timeout=timeout,
-                connector=connector
-            )
-        return self._session
+        """Get the process-wide Gamma API session."""
+        return await get_shared_session()
     
     async def close(self) -> None:
-        """Close the HTTP session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """Close the shared HTTP session (the next request reopens it)."""
+        if self._inflight is not None and not self._inflight.done():
+            self._inflight.cancel()
+        await close_shared_session()
+    
+    def _breaker_allows(self) -> bool:
+        """Check whether a Gamma API request may go out, moving OPEN to HALF_OPEN after the cooldown."""
+        if self._breaker_state == BREAKER_CLOSED:
+            return True
+        if (
+            self._breaker_state == BREAKER_OPEN
+            and time.monotonic() - self._opened_at >= BREAKER_COOLDOWN
+        ):
+            self._breaker_state = BREAKER_HALF_OPEN
+            logger.debug("Gamma API circuit half-open, sending probe")
+            return True
+        return False  # Open, or a probe is already in flight
+    
+    def _record_success(self) -> None:
+        """Close the circuit after a successful fetch."""
+        if self._breaker_state != BREAKER_CLOSED:
+            logger.info("✅ Gamma API reachable again")
+        self._breaker_state = BREAKER_CLOSED
+        self._failure_count = 0
+    
+    def _record_failure(self) -> None:
+        """Count a failed fetch, opening the circuit at the threshold or on a failed probe."""
+        self._failure_count += 1
+        if self._breaker_state == BREAKER_CLOSED and self._failure_count < BREAKER_FAILURE_THRESHOLD:
+            return
+        if self._breaker_state == BREAKER_CLOSED:
+            logger.error(
+                f"Gamma API failed {self._failure_count} times in a row. "
+                f"Pausing fetches for {BREAKER_COOLDOWN:.0f}s; bot will continue with cached markets."
+            )
+        self._breaker_state = BREAKER_OPEN
+        self._opened_at = time.monotonic()
     
     async def _fetch_crypto_markets(self) -> List[Dict[str, Any]]:
+        """
+        Fetch all active crypto markets, sharing one request between concurrent callers.
+        
+        Returns:
+            List of market dictionaries
+        """
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.ensure_future(self._request_crypto_markets())
+        # Shield so a cancelled caller doesn't cancel the fetch for the others
+        return await asyncio.shield(self._inflight)
+    
+    async def _request_crypto_markets(self) -> List[Dict[str, Any]]:
         """
         Fetch all active crypto markets from Gamma API with retry logic.
         
+        Guarded by a circuit breaker: while open, returns [] without a
+        request; after the cooldown a single probe decides whether it closes.
+        
         Returns:
             List of market dictionaries
         """
+        if not self._breaker_allows():
+            logger.debug("Skipping Gamma API fetch - circuit open")
+            return []
+        
         session = await self._get_session()
         
         url = f"{GAMMA_API_BASE}/markets"
@@ -124,103 +355,101 @@ class MarketDiscovery:
             "limit": 200
         }
         
-        # If API was previously unreachable, only retry every 5 minutes
-        import time
-        if self._api_unreachable:
-            if time.time() - self._last_error_logged < 300:  # 5 minutes
-                logger.debug("Skipping Gamma API fetch - marked as unreachable")
-                return []
-        
-        max_retries = 3
+        # Stay quiet while recovering, and probe with a single attempt
+        quiet = self._breaker_state != BREAKER_CLOSED
+        max_retries = 1 if self._breaker_state == BREAKER_HALF_OPEN else 3
         for attempt in range(max_retries):
             try:
                 async with session.get(url, params=params) as response:
                     response.raise_for_status()
-                    data = await response.json()
+                    if ijson is not None:
+                        # Stream the array, keeping only candidate markets
+                        data = [
+                            market_data
+                            async for market_data in ijson.items(response.content, "item", use_float=True)
+                            if _is_candidate(market_data)
+                        ]
+                    else:
+                        payload = _json_loads(await response.read())
+                        data = [m for m in payload if _is_candidate(m)] if isinstance(payload, list) else []
                     
                     # Sort by end_date_iso (newest first) - client-side
-                    if isinstance(data, list):
-                        data.sort(
-                            key=lambda m: m.get('end_date_iso') or m.get('endDateIso') or '', 
-                            reverse=True
-                        )
+                    data.sort(
+                        key=lambda m: m.get('end_date_iso') or m.get('endDateIso') or '', 
+                        reverse=True
+                    )
                     
-                    logger.debug(f"Fetched {len(data) if isinstance(data, list) else 0} 15-min crypto markets")
-                    # Reset unreachable flag on success
-                    self._api_unreachable = False
-                    return data if isinstance(data, list) else []
+                    logger.debug(f"Fetched {len(data)} candidate 15-min crypto markets")
+                    self._record_success()
+                    return data
                     
             except aiohttp.ClientConnectorError as e:
                 if attempt < max_retries - 1:
-                    wait_time = 2 ** attempt
-                    # Only log warning on first cycle
-                    if not self._api_unreachable:
+                    wait_time = _retry_delay(attempt)
+                    if not quiet:
                         logger.warning(
                             f"Connection error to Gamma API (attempt {attempt + 1}/{max_retries}): {e}. "
-                            f"Retrying in {wait_time}s..."
+                            f"Retrying in {wait_time:.1f}s..."
                         )
                     await asyncio.sleep(wait_time)
                 else:
-                    # Only log error once every 5 minutes
-                    if not self._api_unreachable:
+                    if not quiet:
                         logger.error(
                             f"Failed to connect to Gamma API after {max_retries} attempts. "
-                            f"Network may be unreachable. Bot will continue with cached markets. "
-                            f"(This message will not repeat for 5 minutes)"
+                            f"Network may be unreachable."
                         )
-                    self._api_unreachable = True
-                    self._last_error_logged = time.time()
+                    self._record_failure()
                     return []
                     
             except asyncio.TimeoutError:
                 if attempt < max_retries - 1:
-                    if not self._api_unreachable:
+                    if not quiet:
                         logger.warning(f"Timeout fetching markets (attempt {attempt + 1}/{max_retries}), retrying...")
-                    await asyncio.sleep(2 ** attempt)
+                    await asyncio.sleep(_retry_delay(attempt))
                 else:
-                    if not self._api_unreachable:
-                        logger.error(f"Timeout after {max_retries} attempts. (This message will not repeat for 5 minutes)")
-                    self._api_unreachable = True
-                    self._last_error_logged = time.time()
+                    if not quiet:
+                        logger.error(f"Timeout after {max_retries} attempts.")
+                    self._record_failure()
                     return []
                     
             except aiohttp.ClientError as e:
-                if not self._api_unreachable:
+                if not quiet:
                     logger.error(f"HTTP error fetching markets: {e}")
-                self._api_unreachable = True
-                self._last_error_logged = time.time()
+                self._record_failure()
                 return []
                 
             except Exception as e:
                 logger.error(f"Unexpected error fetching markets: {e}", exc_info=True)
+                self._record_failure()
                 return []
         
         return []
     
-    def _parse_asset(self, question: str) -> Optional[str]:
+    def _parse_question(self, question: str) -> Optional[Tuple[str, Optional[float]]]:
         """
-        Extract asset (BTC/ETH) from market question.
+        Extract asset (BTC/ETH) and strike price from market question.
+        
+        A single regex pass picks up the asset and a following "$X,XXX"
+        strike; the slower strike patterns only run when that finds none.
         
         Args:
             question: Market question text
             
         Returns:
-            "BTC", "ETH", or None if not a crypto market
+            (asset, strike_price) with strike_price None if not found,
+            or None if not a BTC/ETH market
         """
-        question_lower = question.lower()
-        
-        btc_patterns = ["btc", "bitcoin"]
-        eth_patterns = ["eth", "ethereum"]
+        match = _RE_PARSE.search(question)
+        if not match:
+            return None
         
-        for pattern in btc_patterns:
-            if pattern in question_lower:
-                return "BTC"
+        asset = "BTC" if match.group("asset")[0] in "bB" else "ETH"
         
-        for pattern in eth_patterns:
-            if pattern in question_lower:
-                return "ETH"
+        strike = match.group("strike")
+        if strike:
+            return asset, _strike_value(strike, match.group("frac"))
         
-        return None
+        return asset, self._parse_strike_price(question)
     
     def _is_15min_market(self, question: str, slug: str) -> bool:
         """
@@ -233,52 +462,30 @@ class MarketDiscovery:
         Returns:
             True if 15-minute market
         """
-        combined = f"{question} {slug}".lower()
-        
-        patterns = [
-            r"15[\s-]?min",
-            r"15[\s-]?minute",
-            r"15m\b",
-            "fifteen minute",
-            "fifteen-minute"
-        ]
-        
-        for pattern in patterns:
-            if re.search(pattern, combined):
-                return True
-        
-        return False
+        return bool(_RE_15MIN.search(question) or _RE_15MIN.search(slug))
     
     def _parse_strike_price(self, question: str) -> Optional[float]:
         """
         Extract strike price from market question.
         
         Examples:
-        - "Will BTC be above $95,000 at 14:15?" -> 95000.0
-        - "Will ETH be above $3,500 at 14:30?" -> 3500.0
+        - "Will BTC be above $95,000 at 14:15?" -> 95000
+        - "Will ETH be above $3,500.50 at 14:30?" -> 3500.5
         
         Args:
             question: Market question text
             
         Returns:
-            Strike price as float, or None if not found
+            Strike price (int when integral), or None if not found
         """
-        # Pattern: $X,XXX or $X,XXX,XXX with optional decimals
-        patterns = [
-            r"\$([0-9,]+(?:\.[0-9]+)?)",
-            r"(\d{1,3}(?:,\d{3})+)(?:\s*(?:USD|USDT))?",
-            r"above\s+(\d+(?:,\d+)*(?:\.\d+)?)"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, question)
-            if match:
-                price_str = match.group(1).replace(",", "")
-                try:
-                    return float(price_str)
-                except ValueError:
-                    continue
+        match = _RE_STRIKE.search(question)
+        if not match:
+            return None
         
+        groups = match.groups()
+        for i in (0, 2, 4):
+            if groups[i]:
+                return _strike_value(groups[i], groups[i + 1])
         return None
     
     def _parse_end_time(self, market_data: Dict[str, Any]) -> Optional[datetime]:
@@ -314,18 +521,15 @@ class MarketDiscovery:
         # SECOND: Try ISO format date fields (only if they have time component)
         end_time_fields = ["end_date_iso", "endDateIso", "end_date", "endDate", "resolution_date"]
         
-        for field in end_time_fields:
-            if field in market_data and market_data[field]:
+        for key in end_time_fields:
+            if key in market_data and market_data[key]:
                 try:
-                    dt_str = market_data[field]
+                    dt_str = market_data[key]
                     # Skip if it's just a date without time (e.g. "2026-01-12")
                     if len(dt_str) <= 10:
                         continue
-                        
-                    if dt_str.endswith("Z"):
-                        dt_str = dt_str[:-1] + "+00:00"
                     
-                    dt = datetime.fromisoformat(dt_str)
+                    dt = _parse_iso(dt_str)
                     if dt.tzinfo is None:
                         dt = dt.replace(tzinfo=timezone.utc)
                     return dt
@@ -334,10 +538,10 @@ class MarketDiscovery:
         
         # THIRD: Try Unix timestamp fields
         timestamp_fields = ["end_timestamp", "endTimestamp"]
-        for field in timestamp_fields:
-            if field in market_data:
+        for key in timestamp_fields:
+            if key in market_data:
                 try:
-                    ts = int(market_data[field])
+                    ts = int(market_data[key])
                     return datetime.fromtimestamp(ts, tz=timezone.utc)
                 except (ValueError, TypeError):
                     continue
@@ -354,46 +558,48 @@ class MarketDiscovery:
         Returns:
             Tuple of (token_id_yes, token_id_no)
         """
-        token_yes = None
-        token_no = None
-        
-        # Check for tokens array
-        tokens = market_data.get("tokens", [])
-        if tokens and len(tokens) >= 2:
-            for token in tokens:
-                outcome = token.get("outcome", "").upper()
-                token_id = token.get("token_id") or token.get("tokenId")
-                if outcome == "YES":
-                    token_yes = token_id
-                elif outcome == "NO":
-                    token_no = token_id
-        
-        # Fallback: check for direct token_id fields
-        if not token_yes:
-            token_yes = market_data.get("token_id_yes") or market_data.get("clobTokenIds", [None, None])[0]
-        if not token_no:
-            token_no = market_data.get("token_id_no") or market_data.get("clobTokenIds", [None, None])[1] if len(market_data.get("clobTokenIds", [])) > 1 else None
-        
-        # Another fallback: outcomes structure
-        outcomes = market_data.get("outcomes", [])
-        if len(outcomes) >= 2 and not (token_yes and token_no):
-            for outcome in outcomes:
-                if isinstance(outcome, dict):
-                    name = outcome.get("name", "").upper()
-                    tid = outcome.get("token_id") or outcome.get("tokenId")
-                    if name == "YES":
-                        token_yes = tid
-                    elif name == "NO":
-                        token_no = tid
+        token_yes = token_no = None
+        for key, accessor in _TOKEN_ACCESSORS:
+            if key not in market_data:
+                continue
+            found_yes, found_no = accessor(market_data)
+            token_yes = token_yes or found_yes
+            token_no = token_no or found_no
+            if token_yes and token_no:
+                break
         
         return token_yes, token_no
     
-    def _parse_market(self, market_data: Dict[str, Any]) -> Optional[Market]:
+    def _gamma_end_time(self, market_data: Dict[str, Any]) -> datetime:
+        """
+        End time for Gamma's actual layout: trailing slug timestamp, else endDate.
+        
+        Same precedence as _parse_end_time, without the field search.
+        Raises KeyError/ValueError when the market doesn't fit that layout.
+        
+        Args:
+            market_data: Raw market data from Gamma API
+            
+        Returns:
+            End time as datetime
+        """
+        tail = market_data["slug"].rsplit("-", 1)[-1]
+        if len(tail) >= 10 and tail.isdigit():
+            return datetime.fromtimestamp(int(tail), tz=timezone.utc)
+        
+        dt_str = market_data["endDate"]
+        if len(dt_str) <= 10:
+            raise ValueError(f"endDate has no time component: {dt_str}")
+        dt = _parse_iso(dt_str)
+        return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+    
+    def _parse_market(self, market_data: Dict[str, Any], now: datetime) -> Optional[Market]:
         """
         Parse raw API response into Market object.
         
         Args:
             market_data: Raw market data from Gamma API
+            now: Current UTC time, taken once per scan
             
         Returns:
             Market object or None if parsing fails
@@ -401,28 +607,20 @@ class MarketDiscovery:
         question = market_data.get("question", "")
         slug = market_data.get("slug", "")
         
-        # Check if this is a BTC/ETH market
-        asset = self._parse_asset(question)
-        if not asset:
-            return None  # Not BTC or ETH, skip silently
-        
-        # Check if 15-min market
-        if not self._is_15min_market(question, slug):
-            logger.debug(f"Not a 15-min market: {question[:50]}")
-            return None
-        
-        # Parse end time
-        end_time = self._parse_end_time(market_data)
+        # Parse end time: Gamma's usual layout first, generic field search otherwise
+        try:
+            end_time = self._gamma_end_time(market_data)
+        except (KeyError, IndexError, TypeError, ValueError, OverflowError, OSError):
+            end_time = self._parse_end_time(market_data)
         if not end_time:
-            logger.warning(f"Could not parse end time for: {question[:50]}")
+            logger.debug(f"Could not parse end time for: {question[:50]}")
             return None
         
         # Check time window
-        now = datetime.now(timezone.utc)
         seconds_to_expiry = (end_time - now).total_seconds()
         
         # Log time info for debugging
-        logger.debug(f"Market {asset}: expires in {seconds_to_expiry:.0f}s (window: {self.min_time_to_expiry}-{self.max_time_to_expiry}s)")
+        logger.debug(f"Market {slug or question[:50]}: expires in {seconds_to_expiry:.0f}s (window: {self.min_time_to_expiry}-{self.max_time_to_expiry}s)")
         
         if seconds_to_expiry < 0:
             logger.debug(f"Market EXPIRED: {question[:50]}")
@@ -436,15 +634,30 @@ class MarketDiscovery:
             logger.debug(f"Too far from expiry ({seconds_to_expiry:.0f}s > {self.max_time_to_expiry}s): {question[:50]}")
             return None
         
-        # Parse strike price (optional for Up/Down markets)
-        strike_price = self._parse_strike_price(question)
+        # Check if this is a BTC/ETH market
+        parsed = self._parse_question(question)
+        if not parsed:
+            return None  # Not BTC or ETH, skip silently
+        asset, strike_price = parsed
+        
+        # Check if 15-min market
+        if not self._is_15min_market(question, slug):
+            logger.debug(f"Not a 15-min market: {question[:50]}")
+            return None
+        
+        # Strike price is optional for Up/Down markets
         if strike_price is None:
             # Default to 0 for Up/Down markets that don't have explicit strike prices
             logger.debug(f"No strike price in question, using 0: {question[:50]}")
             strike_price = 0.0
         
-        # Get token IDs
-        token_yes, token_no = self._extract_token_ids(market_data)
+        # Get token IDs (Gamma sends clobTokenIds; other layouts go the long way)
+        try:
+            token_yes, token_no = _tokens_from_clob_ids(market_data)
+        except (KeyError, TypeError):
+            token_yes = token_no = None
+        if not token_yes or not token_no:
+            token_yes, token_no = self._extract_token_ids(market_data)
         if not token_yes or not token_no:
             logger.debug(f"Missing token IDs for: {question[:50]}")
             return None
@@ -472,12 +685,13 @@ class MarketDiscovery:
             Market object or None if not found
         """
         markets = await self._fetch_crypto_markets()
+        now = datetime.now(timezone.utc)
         
         for market_data in markets:
-            market = self._parse_market(market_data)
+            market = self._parse_market(market_data, now)
             if market and market.asset == asset:
                 logger.info(f"Found {asset} market: {market}")
-                self._markets[asset] = market
+                self._cache_market(market, now.timestamp())
                 return market
         
         logger.debug(f"No active {asset} 15-min market found")
@@ -493,8 +707,17 @@ class MarketDiscovery:
         Returns:
             Dictionary mapping asset to Market
         """
+        # Skip the Gamma fetch while every requested market is still fresh
+        now_mono = time.monotonic()
+        cached = {asset: self._markets.get(asset) for asset in assets}
+        if all(entry and entry[1] > now_mono for entry in cached.values()):
+            logger.debug(f"Using cached markets for {assets}")
+            return {asset: entry[0] for asset, entry in cached.items()}
+        
         markets = await self._fetch_crypto_markets()
         result: Dict[str, Market] = {}
+        now = datetime.now(timezone.utc)
+        now_ts = now.timestamp()
         
         logger.info(f"🔍 Scanning {len(markets)} markets from API for assets: {assets}")
         
@@ -502,9 +725,9 @@ class MarketDiscovery:
             question = market_data.get("question", "N/A")
             logger.debug(f"  [{i+1}] Checking: {question[:80]}")
             
-            market = self._parse_market(market_data)
+            market = self._parse_market(market_data, now)
             if market:
-                logger.debug(f"      ✓ Parsed: {market.asset} @ ${market.strike_price}, expires in {market.seconds_to_expiry}s")
+                logger.debug(f"      ✓ Parsed: {market.asset} @ ${market.strike_price}, expires in {market.seconds_to_expiry_from(now_ts)}s")
                 if market.asset in assets and market.asset not in result:
                     logger.info(f"✅ Found market: {market}")
                     result[market.asset] = market
@@ -514,15 +737,36 @@ class MarketDiscovery:
         if not result:
             logger.warning(f"❌ No markets found for {assets}. API returned {len(markets)} total markets.")
         
-        self._markets.update(result)
+        for market in result.values():
+            self._cache_market(market, now_ts)
         return result
     
-    def get_cached_market(self, asset: str) -> Optional[Market]:
-        """Get cached market for asset (if still valid)."""
-        market = self._markets.get(asset)
-        if market and market.is_tradeable:
-            return market
-        return None
+    def _cache_market(self, market: Market, now_ts: float) -> None:
+        """
+        Cache a market until it nears the expiry cutoff (at most MARKET_CACHE_TTL).
+        
+        Args:
+            market: Market to cache
+            now_ts: Current Unix timestamp
+        """
+        ttl = min(market.seconds_to_expiry_from(now_ts) - self.min_time_to_expiry, MARKET_CACHE_TTL)
+        self._markets[market.asset] = (market, time.monotonic() + max(0.0, ttl))
+    
+    def get_cached_market(self, asset: str, now_ts: Optional[float] = None) -> Optional[Market]:
+        """
+        Get cached market for asset (if still valid).
+        
+        Args:
+            asset: "BTC" or "ETH"
+            now_ts: Current Unix timestamp, to share one clock read across calls
+        """
+        entry = self._markets.get(asset)
+        if entry is None:
+            return None
+        market = entry[0]
+        if now_ts is None:
+            now_ts = time.time()
+        return market if market.seconds_to_expiry_from(now_ts) > 0 else None
     
     async def scan_loop(self, assets: List[str], stop_event: asyncio.Event) -> None:
         """
@@ -533,16 +777,20 @@ class MarketDiscovery:
             stop_event: Event to signal loop termination
         """
         logger.info(f"Starting market scanner for: {assets}")
+        loop = asyncio.get_running_loop()
         
         while not stop_event.is_set():
+            # Fixed-rate schedule: the interval runs while the scan is in flight
+            next_scan_at = loop.time() + self.scan_interval
             try:
                 await self.find_all_markets(assets)
                 
                 # Log current market status
+                now_ts = time.time()
                 for asset in assets:
-                    market = self.get_cached_market(asset)
+                    market = self.get_cached_market(asset, now_ts)
                     if market:
-                        logger.info(f"{asset}: {market.question} ({market.seconds_to_expiry}s to expiry)")
+                        logger.info(f"{asset}: {market.question} ({market.seconds_to_expiry_from(now_ts)}s to expiry)")
                     else:
                         logger.debug(f"{asset}: No active market")
                 
@@ -553,7 +801,7 @@ class MarketDiscovery:
             try:
                 await asyncio.wait_for(
                     stop_event.wait(),
-                    timeout=self.scan_interval
+                    timeout=max(0.0, next_scan_at - loop.time())
                 )
             except asyncio.TimeoutError:
                 pass  # Normal timeout, continue scanning
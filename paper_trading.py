@@ -6,46 +6,92 @@ No real trades are executed - all positions are tracked in memory.
 """
 
 import logging
-import random
+import time
+from collections import deque
+from itertools import islice
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from enum import IntEnum
+from typing import Deque, Dict, List, Optional, Any, Tuple, Union
+
+import numpy as np
 
 from market_discovery import Market
-from volatility import Signal
+from positions import BasePositionManager
+from volatility import (
+    Direction, Signal,
+    EXIT_MEAN_REVERSION, EXIT_OVER_CORRECTION, EXIT_MARKET_CLOSED,
+)
 
 logger = logging.getLogger(__name__)
 
+RECENT_TRADES_KEPT = 100     # Default TradeRecord objects kept for get_recent_trades
+OBJECT_POOL_SIZE = 256       # Recycled PaperOrderResult / TradeRecord objects kept
+TRADE_ARRAY_CAPACITY = 1024  # Initial per-trade stats capacity (doubles when full)
+RNG_BUFFER_SIZE = 65536      # U(0,1) samples drawn per refill of the simulation buffer
+
 
-@dataclass
+class Side(IntEnum):
+    """Order side; the value is the sign applied to simulated slippage."""
+    
+    BUY = 1
+    SELL = -1
+    
+    def __str__(self) -> str:
+        return self.name
+    
+    @classmethod
+    def coerce(cls, value: Union["Side", str]) -> "Side":
+        """Accept a Side or its name ("BUY"/"SELL")."""
+        return value if isinstance(value, cls) else cls[value]
+
+
+@dataclass(slots=True)
 class PaperPosition:
     """Simulated position."""
     
     position_id: str
     market: Market
     token_id: str
-    direction: str          # "YES" or "NO"
+    direction: Direction    # YES or NO ("YES"/"NO" accepted)
     entry_price: float      # Simulated entry price
     shares: float
     amount_usdc: float
     entry_zscore: float
     entry_time: datetime
+    direction_sign: int = field(init=False, repr=False)  # +1 YES, -1 NO
+    slot: int = field(default=-1, init=False, repr=False)  # Row in the manager's hot block
+    asset: str = field(init=False, repr=False)             # Snapshot of market.asset
+    strike_price: float = field(init=False, repr=False)    # Snapshot of market.strike_price
+    expiry_ts: float = field(init=False, repr=False)       # Snapshot of market end time (Unix)
+    entry_monotonic: float = field(default_factory=time.monotonic, repr=False)  # For age
     
-    @property
-    def asset(self) -> str:
-        return self.market.asset
+    def __post_init__(self):
+        self.direction = Direction.coerce(self.direction)
+        self.direction_sign = int(self.direction)
+        self.asset = self.market.asset
+        self.strike_price = self.market.strike_price
+        self.expiry_ts = self.market.end_time_epoch
+    
+    def age_seconds_at(self, now: datetime) -> int:
+        return int((now - self.entry_time).total_seconds())
+    
+    def age_seconds_from(self, now_monotonic: float) -> int:
+        return int(now_monotonic - self.entry_monotonic)
     
     @property
     def age_seconds(self) -> int:
-        delta = datetime.now(timezone.utc) - self.entry_time
-        return int(delta.total_seconds())
+        return int(time.monotonic() - self.entry_monotonic)
+    
+    def time_to_expiry_at(self, now_ts: float) -> int:
+        return max(0, int(self.expiry_ts - now_ts))
     
     @property
     def time_to_expiry(self) -> int:
-        return self.market.seconds_to_expiry
+        return self.time_to_expiry_at(time.time())
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperOrderResult:
     """Simulated order result."""
     
@@ -55,14 +101,10 @@ class PaperOrderResult:
     avg_price: float = 0.0
     amount_spent: float = 0.0
     error: Optional[str] = None
-    timestamp: datetime = None
-    
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now(timezone.utc)
+    timestamp: Optional[datetime] = None  # Fill time; None for failed orders
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeRecord:
     """Record of a completed trade for statistics."""
     
@@ -87,26 +129,41 @@ class PaperTradingEngine:
     without making real API calls to Polymarket.
     """
     
-    def __init__(self, initial_balance: float = 50.0):
+    def __init__(
+        self,
+        initial_balance: float = 50.0,
+        seed: Optional[int] = None,
+        max_history: int = RECENT_TRADES_KEPT
+    ):
         """
         Args:
             initial_balance: Starting balance in USDC (default $50)
+            seed: Seed for the simulation RNG (default: fresh entropy)
+            max_history: Trade records kept for get_recent_trades (statistics cover all trades)
         """
         self.initial_balance = initial_balance
         self.balance = initial_balance
         
+        # Simulation randomness: U(0,1) samples drawn in bulk, consumed one by one
+        self._rng = np.random.default_rng(seed)
+        self._rng_buf: List[float] = self._rng.random(RNG_BUFFER_SIZE).tolist()
+        self._rng_idx = 0
+        
         # Simulated positions
         self._positions: Dict[str, PaperPosition] = {}
         self._position_counter = 0
         
-        # Trade history
-        self._trades: List[TradeRecord] = []
+        # Recent trade history (full records only for the tail)
+        self._trades: Deque[TradeRecord] = deque(maxlen=max_history)
+        
+        # Free lists of recycled result/record objects
+        self._result_pool: Deque[PaperOrderResult] = deque(maxlen=OBJECT_POOL_SIZE)
+        self._record_pool: Deque[TradeRecord] = deque(maxlen=OBJECT_POOL_SIZE)
         
-        # Statistics
-        self._total_trades = 0
-        self._winning_trades = 0
-        self._losing_trades = 0
-        self._total_pnl = 0.0
+        # Statistics: one slot per closed trade, aggregated with NumPy
+        self._pnl = np.empty(TRADE_ARRAY_CAPACITY, dtype=np.float64)
+        self._pnl_pct = np.empty(TRADE_ARRAY_CAPACITY, dtype=np.float64)
+        self._n_trades = 0
         
         # Losing streak protection
         self._consecutive_losses = 0
@@ -120,24 +177,82 @@ class PaperTradingEngine:
         self._position_counter += 1
         return f"PAPER_{self._position_counter:06d}"
     
-    def _simulate_slippage(self, fair_price: float, side: str) -> float:
+    def _new_result(
+        self,
+        success: bool,
+        order_id: Optional[str] = None,
+        shares: float = 0.0,
+        avg_price: float = 0.0,
+        amount_spent: float = 0.0,
+        error: Optional[str] = None,
+        timestamp: Optional[datetime] = None
+    ) -> PaperOrderResult:
+        """Get a PaperOrderResult from the pool (or a fresh one) and fill it in."""
+        # Only fills get a timestamp: skip the clock read on the rejection path
+        if timestamp is None and success:
+            timestamp = datetime.now(timezone.utc)
+        
+        if not self._result_pool:
+            return PaperOrderResult(success, order_id, shares, avg_price, amount_spent, error, timestamp)
+        
+        result = self._result_pool.pop()
+        result.success = success
+        result.order_id = order_id
+        result.shares = shares
+        result.avg_price = avg_price
+        result.amount_spent = amount_spent
+        result.error = error
+        result.timestamp = timestamp
+        return result
+    
+    def recycle(self, result: PaperOrderResult) -> None:
+        """
+        Return an order result to the pool once the caller is done with it.
+        
+        Args:
+            result: Result previously returned by this engine (not used afterwards)
+        """
+        self._result_pool.append(result)
+    
+    def _u01(self) -> float:
+        """Next U(0,1) sample from the buffer, refilling it when used up."""
+        i = self._rng_idx
+        if i == RNG_BUFFER_SIZE:
+            self._rng_buf = self._rng.random(RNG_BUFFER_SIZE).tolist()
+            i = 0
+        self._rng_idx = i + 1
+        return self._rng_buf[i]
+    
+    def _simulate_slippage(self, fair_price: float, side: Side) -> float:
         """
         Simulate realistic slippage.
         
         Args:
             fair_price: The "fair" or mid price
-            side: "BUY" or "SELL"
+            side: Side.BUY (pay up) or Side.SELL (receive less)
             
         Returns:
             Simulated execution price
         """
-        # Random slippage 0-2%
-        slippage = random.uniform(0.0, 0.02)
+        # Random slippage 0-2%, against us on either side
+        return fair_price * (1 + self._u01() * 0.02 * side)
+    
+    def _simulate_slippage_batch(self, fair_prices: np.ndarray, sides: np.ndarray) -> np.ndarray:
+        """
+        Vectorized _simulate_slippage for replaying many orders at once.
         
-        if side == "BUY":
-            return fair_price * (1 + slippage)
-        else:
-            return fair_price * (1 - slippage)
+        Args:
+            fair_prices: Fair/mid price per order
+            sides: Side values (or "BUY"/"SELL" names) per order
+            
+        Returns:
+            Simulated execution price per order
+        """
+        fair_prices = np.asarray(fair_prices, dtype=np.float64)
+        sides = np.asarray(sides)
+        if sides.dtype.kind in "US":
+            sides = np.where(sides == "SELL", Side.SELL, Side.BUY)
+        return fair_prices * (1.0 + 0.02 * self._rng.random(fair_prices.shape) * sides)
     
     def test_connection(self) -> bool:
         """Always returns True for paper trading."""
@@ -149,26 +264,28 @@ class PaperTradingEngine:
         Simulate getting midpoint price.
         Returns a random price between 0.3 and 0.7 (typical range).
         """
-        return random.uniform(0.35, 0.65)
+        return 0.35 + 0.3 * self._u01()
     
-    def get_best_price(self, token_id: str, side: str = "BUY") -> Optional[float]:
+    def get_best_price(self, token_id: str, side: Union[Side, str] = Side.BUY) -> Optional[float]:
         """Simulate getting best price."""
         mid = self.get_midpoint(token_id)
-        return self._simulate_slippage(mid, side)
+        return self._simulate_slippage(mid, Side.coerce(side))
     
     def place_market_order(
         self,
         market: Market,
-        direction: str,
-        amount_usdc: float
+        direction: Direction,
+        amount_usdc: float,
+        timestamp: Optional[datetime] = None
     ) -> PaperOrderResult:
         """
         Simulate placing a market order.
         
         Args:
             market: Target market
-            direction: "YES" or "NO"
+            direction: Direction.YES/NO (or "YES"/"NO")
             amount_usdc: Amount to spend in USDC
+            timestamp: Execution time to stamp on the result (default: now)
             
         Returns:
             Simulated order result
@@ -176,17 +293,18 @@ class PaperTradingEngine:
         # Check balance
         if amount_usdc > self.balance:
             logger.warning(
-                f"📝 Paper: Insufficient balance. "
-                f"Need ${amount_usdc:.2f}, have ${self.balance:.2f}"
+                "📝 Paper: Insufficient balance. Need $%.2f, have $%.2f",
+                amount_usdc, self.balance
             )
-            return PaperOrderResult(
+            return self._new_result(
                 success=False,
-                error=f"Insufficient balance: ${self.balance:.2f}"
+                error=f"Insufficient balance: ${self.balance:.2f}",
+                timestamp=timestamp
             )
         
         # Simulate execution
-        token_id = market.token_id_yes if direction == "YES" else market.token_id_no
-        entry_price = self._simulate_slippage(0.5, "BUY")  # Typical price around 0.5
+        direction = Direction.coerce(direction)
+        entry_price = self._simulate_slippage(0.5, Side.BUY)  # Typical price around 0.5
         shares = amount_usdc / entry_price
         
         # Deduct from balance
@@ -194,20 +312,44 @@ class PaperTradingEngine:
         
         order_id = self._generate_order_id()
         
-        logger.info(
-            f"📝 Paper Order: {direction} on {market.asset} @ ${market.strike_price:,.0f} | "
-            f"Price: {entry_price:.3f} | Shares: {shares:.2f} | "
-            f"Spent: ${amount_usdc:.2f} | Balance: ${self.balance:.2f}"
-        )
+        # %-style has no thousands separator, so guard the f-string instead
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"📝 Paper Order: {direction} on {market.asset} @ ${market.strike_price:,.0f} | "
+                f"Price: {entry_price:.3f} | Shares: {shares:.2f} | "
+                f"Spent: ${amount_usdc:.2f} | Balance: ${self.balance:.2f}"
+            )
         
-        return PaperOrderResult(
+        return self._new_result(
             success=True,
             order_id=order_id,
             shares=shares,
             avg_price=entry_price,
-            amount_spent=amount_usdc
+            amount_spent=amount_usdc,
+            timestamp=timestamp
         )
     
+    def place_market_orders_batch(
+        self,
+        orders: List[tuple]
+    ) -> List[PaperOrderResult]:
+        """
+        Simulate a batch of market orders.
+        
+        Args:
+            orders: (market, direction, amount_usdc) tuples
+            
+        Returns:
+            One simulated order result per order
+        """
+        now = datetime.now(timezone.utc)
+        return [self.place_market_order(*order, timestamp=now) for order in orders]
+    
+    def _simulate_exit_price(self) -> float:
+        """Simulated sell price (with some variance to simulate wins/losses)."""
+        # Slightly biased towards wins for mean reversion strategy
+        return 0.45 + 0.2 * self._u01()
+    
     def sell_position(
         self,
         token_id: str,
@@ -225,9 +367,7 @@ class PaperTradingEngine:
         Returns:
             Simulated order result
         """
-        # Simulate exit price (with some variance to simulate wins/losses)
-        # Slightly biased towards wins for mean reversion strategy
-        exit_price = random.uniform(0.45, 0.65)
+        exit_price = self._simulate_exit_price()
         proceeds = shares * exit_price
         
         # Add to balance
@@ -236,11 +376,11 @@ class PaperTradingEngine:
         order_id = self._generate_order_id()
         
         logger.info(
-            f"📝 Paper Sell: {shares:.2f} shares @ {exit_price:.3f} | "
-            f"Proceeds: ${proceeds:.2f} | Balance: ${self.balance:.2f}"
+            "📝 Paper Sell: %.2f shares @ %.3f | Proceeds: $%.2f | Balance: $%.2f",
+            shares, exit_price, proceeds, self.balance
         )
         
-        return PaperOrderResult(
+        return self._new_result(
             success=True,
             order_id=order_id,
             shares=shares,
@@ -256,7 +396,7 @@ class PaperTradingEngine:
         """Nothing to cancel in paper trading."""
         return True
     
-    def cancel_all_orders(self) -> bool:
+    def cancel_all_orders(self, market: Optional[str] = None) -> bool:
         """Nothing to cancel in paper trading."""
         return True
     
@@ -269,11 +409,47 @@ class PaperTradingEngine:
     # PAPER TRADING SPECIFIC METHODS
     # ══════════════════════════════════════════════════════════════════════════
     
+    def close_and_record(self, position: PaperPosition, exit_reason: str) -> PaperOrderResult:
+        """
+        Sell a position and record the trade in one step.
+        
+        Same effect as sell_position followed by record_trade, computing the
+        proceeds once.
+        
+        Args:
+            position: The position being closed
+            exit_reason: Reason for exit
+            
+        Returns:
+            Simulated sell result
+        """
+        shares = position.shares
+        exit_price = self._simulate_exit_price()
+        proceeds = shares * exit_price
+        self.balance += proceeds
+        
+        order_id = self._generate_order_id()
+        logger.info(
+            "📝 Paper Sell: %.2f shares @ %.3f | Proceeds: $%.2f | Balance: $%.2f",
+            shares, exit_price, proceeds, self.balance
+        )
+        
+        self.record_trade(position, exit_price, exit_reason, proceeds)
+        
+        return self._new_result(
+            success=True,
+            order_id=order_id,
+            shares=shares,
+            avg_price=exit_price,
+            amount_spent=proceeds  # Actually received
+        )
+    
     def record_trade(
         self,
         position: PaperPosition,
         exit_price: float,
-        exit_reason: str
+        exit_reason: str,
+        proceeds: Optional[float] = None
     ) -> TradeRecord:
         """
         Record a completed trade for statistics.
@@ -282,6 +458,7 @@ class PaperTradingEngine:
             position: The closed position
             exit_price: Exit price
             exit_reason: Reason for exit
+            proceeds: Sale proceeds if already known (default: shares * exit_price)
             
         Returns:
             TradeRecord for the closed trade
@@ -289,157 +466,219 @@ class PaperTradingEngine:
         # Calculate proceeds and PnL
         # FIXED: Always use proceeds - cost formula
         # For both YES and NO positions, if we sell higher than we bought, we profit
-        proceeds = position.shares * exit_price
+        if proceeds is None:
+            proceeds = position.shares * exit_price
         cost = position.amount_usdc
         pnl = proceeds - cost
         
         pnl_pct = (pnl / cost) * 100 if cost > 0 else 0
         
-        record = TradeRecord(
-            asset=position.asset,
-            direction=position.direction,
-            entry_price=position.entry_price,
-            exit_price=exit_price,
-            shares=position.shares,
-            pnl=pnl,
-            pnl_pct=pnl_pct,
-            duration_seconds=position.age_seconds,
-            entry_time=position.entry_time,
-            exit_time=datetime.now(timezone.utc),
-            exit_reason=exit_reason
+        record = self._store_record(
+            position, exit_price, pnl, pnl_pct, exit_reason, datetime.now(timezone.utc)
         )
         
-        self._trades.append(record)
-        self._total_trades += 1
-        self._total_pnl += pnl
+        if self._n_trades == self._pnl.size:
+            self._grow_trade_arrays(self._n_trades + 1)
+        self._pnl[self._n_trades] = pnl
+        self._pnl_pct[self._n_trades] = pnl_pct
+        self._n_trades += 1
+        
+        self._track_streak(pnl)
+        
+        logger.info(
+            "%s Paper Trade Closed: %s %s | Entry: %.3f | Exit: %.3f | "
+            "Spent: $%.2f | Proceeds: $%.2f | PnL: $%+.2f (%+.1f%%) | Reason: %s",
+            "✅" if pnl >= 0 else "❌", position.asset, position.direction,
+            position.entry_price, exit_price, cost, proceeds, pnl, pnl_pct, exit_reason
+        )
+        
+        self._warn_streak()
+        return record
+    
+    def batch_close(self, closures: List[Tuple[PaperPosition, str]]) -> List[PaperOrderResult]:
+        """
+        Sell several positions and record their trades in one pass.
+        
+        Exit prices, proceeds and PnL are computed as arrays, the balance is
+        credited once and a single summary line is logged.
+        
+        Args:
+            closures: (position, exit_reason) pairs
+            
+        Returns:
+            One simulated sell result per closure, in the same order
+        """
+        n = len(closures)
+        if not n:
+            return []
+        
+        shares = np.fromiter((p.shares for p, _ in closures), dtype=np.float64, count=n)
+        costs = np.fromiter((p.amount_usdc for p, _ in closures), dtype=np.float64, count=n)
+        exit_prices = 0.45 + 0.2 * self._rng.random(n)  # Same draw as _simulate_exit_price
+        proceeds = shares * exit_prices
+        pnl = proceeds - costs  # proceeds - cost, as in record_trade
+        pnl_pct = np.divide(pnl * 100, costs, out=np.zeros(n), where=costs > 0)
+        
+        self.balance += float(proceeds.sum())
+        
+        start = self._n_trades
+        if start + n > self._pnl.size:
+            self._grow_trade_arrays(start + n)
+        self._pnl[start:start + n] = pnl
+        self._pnl_pct[start:start + n] = pnl_pct
+        self._n_trades = start + n
+        
+        now = datetime.now(timezone.utc)
+        results = []
+        for (position, exit_reason), shares_i, price_i, proceeds_i, pnl_i, pnl_pct_i in zip(
+            closures, shares.tolist(), exit_prices.tolist(), proceeds.tolist(),
+            pnl.tolist(), pnl_pct.tolist()
+        ):
+            self._store_record(position, price_i, pnl_i, pnl_pct_i, exit_reason, now)
+            self._track_streak(pnl_i)
+            results.append(self._new_result(
+                success=True,
+                order_id=self._generate_order_id(),
+                shares=shares_i,
+                avg_price=price_i,
+                amount_spent=proceeds_i,  # Actually received
+                timestamp=now
+            ))
         
-        # Track winning/losing streak
+        logger.info(
+            "📝 Paper Batch Close: %d positions | Proceeds: $%.2f | PnL: $%+.2f | Balance: $%.2f",
+            n, float(proceeds.sum()), float(pnl.sum()), self.balance
+        )
+        self._warn_streak()
+        return results
+    
+    def _store_record(
+        self,
+        position: PaperPosition,
+        exit_price: float,
+        pnl: float,
+        pnl_pct: float,
+        exit_reason: str,
+        now: datetime
+    ) -> TradeRecord:
+        """Fill a (pooled) TradeRecord and append it to the history window."""
+        record = (
+            self._record_pool.pop() if self._record_pool
+            else TradeRecord.__new__(TradeRecord)
+        )
+        record.asset = position.asset
+        record.direction = position.direction.name
+        record.entry_price = position.entry_price
+        record.exit_price = exit_price
+        record.shares = position.shares
+        record.pnl = pnl
+        record.pnl_pct = pnl_pct
+        record.duration_seconds = position.age_seconds_from(time.monotonic())
+        record.entry_time = position.entry_time
+        record.exit_time = now
+        record.exit_reason = exit_reason
+        
+        # The oldest record falls out of the history window: recycle it
+        if len(self._trades) == self._trades.maxlen:
+            self._record_pool.append(self._trades.popleft())
+        self._trades.append(record)
+        return record
+    
+    def _grow_trade_arrays(self, needed: int) -> None:
+        """Double the per-trade stats arrays until they hold `needed` trades."""
+        size = self._pnl.size
+        while size < needed:
+            size *= 2
+        extra = size - self._pnl.size
+        self._pnl = np.concatenate((self._pnl, np.empty(extra, dtype=np.float64)))
+        self._pnl_pct = np.concatenate((self._pnl_pct, np.empty(extra, dtype=np.float64)))
+    
+    def _track_streak(self, pnl: float) -> None:
+        """Update the losing streak and trip the forced stop when it gets too long."""
         if pnl >= 0:
-            self._winning_trades += 1
             self._consecutive_losses = 0  # Reset losing streak
         else:
-            self._losing_trades += 1
             self._consecutive_losses += 1
             
             # Check if we hit max consecutive losses
             if self._consecutive_losses >= self._max_consecutive_losses:
                 self._should_stop = True
                 logger.critical(
-                    f"🛑 STOP FORCÉ: {self._consecutive_losses} trades perdants consécutifs! "
-                    f"Le bot va s'arrêter par sécurité."
+                    "🛑 STOP FORCÉ: %d trades perdants consécutifs! "
+                    "Le bot va s'arrêter par sécurité.",
+                    self._consecutive_losses
                 )
-        
-        emoji = "✅" if pnl >= 0 else "❌"
-        logger.info(
-            f"{emoji} Paper Trade Closed: {position.asset} {position.direction} | "
-            f"Entry: {position.entry_price:.3f} | Exit: {exit_price:.3f} | "
-            f"Spent: ${cost:.2f} | Proceeds: ${proceeds:.2f} | "
-            f"PnL: ${pnl:+.2f} ({pnl_pct:+.1f}%) | "
-            f"Reason: {exit_reason}"
-        )
-        
-        # Warn about losing streak
+    
+    def _warn_streak(self) -> None:
+        """Warn about a losing streak that has not yet forced a stop."""
         if self._consecutive_losses >= 3 and not self._should_stop:
             logger.warning(
-                f"⚠️ Attention: {self._consecutive_losses} pertes consécutives "
-                f"({self._max_consecutive_losses - self._consecutive_losses} avant arrêt forcé)"
+                "⚠️ Attention: %d pertes consécutives (%d avant arrêt forcé)",
+                self._consecutive_losses,
+                self._max_consecutive_losses - self._consecutive_losses
             )
-        
-        return record
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get paper trading statistics."""
-        win_rate = (
-            (self._winning_trades / self._total_trades * 100)
-            if self._total_trades > 0 else 0
-        )
+        n = self._n_trades
+        pnl = self._pnl[:n]
+        total_pnl = float(pnl.sum())
+        winning = int(np.count_nonzero(pnl >= 0))
         
         return {
             "initial_balance": self.initial_balance,
             "current_balance": self.balance,
-            "total_pnl": self._total_pnl,
-            "total_pnl_pct": (self._total_pnl / self.initial_balance * 100),
-            "total_trades": self._total_trades,
-            "winning_trades": self._winning_trades,
-            "losing_trades": self._losing_trades,
-            "win_rate": win_rate,
-            "avg_pnl_per_trade": (
-                self._total_pnl / self._total_trades
-                if self._total_trades > 0 else 0
-            )
+            "total_pnl": total_pnl,
+            "total_pnl_pct": (total_pnl / self.initial_balance * 100),
+            "total_trades": n,
+            "winning_trades": winning,
+            "losing_trades": n - winning,
+            "win_rate": (winning / n * 100) if n > 0 else 0,
+            "avg_pnl_per_trade": total_pnl / n if n > 0 else 0,
+            "avg_pnl_pct": float(self._pnl_pct[:n].mean()) if n > 0 else 0
         }
     
     def print_summary(self) -> None:
         """Print trading session summary."""
         stats = self.get_statistics()
         
-        logger.info("=" * 60)
-        logger.info("📊 PAPER TRADING SESSION SUMMARY")
-        logger.info("=" * 60)
-        logger.info(f"Initial Balance:  ${stats['initial_balance']:.2f}")
-        logger.info(f"Current Balance:  ${stats['current_balance']:.2f}")
-        logger.info(f"Total P&L:        ${stats['total_pnl']:+.2f} ({stats['total_pnl_pct']:+.1f}%)")
-        logger.info("-" * 60)
-        logger.info(f"Total Trades:     {stats['total_trades']}")
-        logger.info(f"Winning Trades:   {stats['winning_trades']}")
-        logger.info(f"Losing Trades:    {stats['losing_trades']}")
-        logger.info(f"Win Rate:         {stats['win_rate']:.1f}%")
-        logger.info(f"Avg P&L/Trade:    ${stats['avg_pnl_per_trade']:+.2f}")
-        logger.info("=" * 60)
+        # One log record for the whole block
+        lines = [
+            "=" * 60,
+            "📊 PAPER TRADING SESSION SUMMARY",
+            "=" * 60,
+            f"Initial Balance:  ${stats['initial_balance']:.2f}",
+            f"Current Balance:  ${stats['current_balance']:.2f}",
+            f"Total P&L:        ${stats['total_pnl']:+.2f} ({stats['total_pnl_pct']:+.1f}%)",
+            "-" * 60,
+            f"Total Trades:     {stats['total_trades']}",
+            f"Winning Trades:   {stats['winning_trades']}",
+            f"Losing Trades:    {stats['losing_trades']}",
+            f"Win Rate:         {stats['win_rate']:.1f}%",
+            f"Avg P&L/Trade:    ${stats['avg_pnl_per_trade']:+.2f}",
+            "=" * 60,
+        ]
+        logger.info("\n".join(lines))
     
     def get_recent_trades(self, count: int = 10) -> List[TradeRecord]:
-        """Get most recent trades."""
-        return self._trades[-count:]
+        """
+        Get most recent trades (up to max_history).
+        
+        Records are recycled once they leave the history window, so callers
+        should not hold on to them across many trades.
+        """
+        return list(islice(self._trades, max(0, len(self._trades) - count), None))
 
 
-class PaperPositionManager:
+class PaperPositionManager(BasePositionManager):
     """
     Position manager for paper trading.
     
-    Wraps the real PositionManager logic but uses PaperTradingEngine.
+    Shares bookkeeping and exit evaluation with PositionManager through
+    BasePositionManager; closes are recorded on the PaperTradingEngine.
     """
     
-    def __init__(
-        self,
-        trading_engine: PaperTradingEngine,
-        max_positions: int = 2,
-        exit_zscore_threshold: float = 0.5,
-        force_exit_before_expiry: int = 120
-    ):
-        self.engine = trading_engine
-        self.max_positions = max_positions
-        self.exit_zscore_threshold = exit_zscore_threshold
-        self.force_exit_before_expiry = force_exit_before_expiry
-        
-        self._positions: Dict[str, PaperPosition] = {}
-        self._counter = 0
-    
-    def _generate_position_id(self) -> str:
-        self._counter += 1
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
-        return f"paper_{timestamp}_{self._counter:04d}"
-    
-    @property
-    def open_positions(self) -> List[PaperPosition]:
-        return list(self._positions.values())
-    
-    @property
-    def position_count(self) -> int:
-        return len(self._positions)
-    
-    def can_open_position(self, asset: str) -> bool:
-        if self.position_count >= self.max_positions:
-            return False
-        for pos in self._positions.values():
-            if pos.asset == asset:
-                return False
-        return True
-    
-    def get_position_for_asset(self, asset: str) -> Optional[PaperPosition]:
-        for pos in self._positions.values():
-            if pos.asset == asset:
-                return pos
-        return None
+    id_prefix = "paper"
     
     def open_position(
         self,
@@ -450,9 +689,11 @@ class PaperPositionManager:
         if not order_result.success:
             return None
         
+        now = datetime.now(timezone.utc)
         position_id = self._generate_position_id()
+        direction = Direction.coerce(signal.direction)
         token_id = (
-            market.token_id_yes if signal.direction == "YES"
+            market.token_id_yes if direction == Direction.YES
             else market.token_id_no
         )
         
@@ -460,90 +701,58 @@ class PaperPositionManager:
             position_id=position_id,
             market=market,
             token_id=token_id,
-            direction=signal.direction,
+            direction=direction,
             entry_price=order_result.avg_price,
             shares=order_result.shares,
             amount_usdc=order_result.amount_spent,
             entry_zscore=signal.zscore,
-            entry_time=datetime.now(timezone.utc)
+            entry_time=now
         )
         
-        self._positions[position_id] = position
-        logger.info(f"📝 Paper Position Opened: {position}")
+        self._add_position(position)
+        logger.info("📝 Paper Position Opened: %s", position)
         return position
     
     def close_position(self, position: PaperPosition, reason: str) -> PaperOrderResult:
-        logger.info(f"📝 Closing paper position: {reason}")
+        logger.info("📝 Closing paper position: %s", reason)
         
-        result = self.engine.sell_position(
-            token_id=position.token_id,
-            shares=position.shares
-        )
+        result = self.engine.close_and_record(position, reason)
         
         if result.success:
-            # Record the trade
-            self.engine.record_trade(position, result.avg_price, reason)
-            del self._positions[position.position_id]
+            self._remove_position(position)
         
         return result
     
-    def check_exit_conditions(
-        self,
-        position: PaperPosition,
-        current_zscore: float
-    ) -> Optional[str]:
-        """Returns exit reason string or None."""
-        
-        if abs(current_zscore) <= self.exit_zscore_threshold:
+    def _exit_reason(self, code: int, current_zscore: float, time_to_expiry: int) -> str:
+        """Exit reason string for an EXIT_* code."""
+        if code == EXIT_MEAN_REVERSION:
             return f"mean_reversion (Z={current_zscore:.2f})"
-        
-        if position.direction == "NO" and current_zscore < -self.exit_zscore_threshold:
+        if code == EXIT_OVER_CORRECTION:
             return f"over_correction (Z={current_zscore:.2f})"
-        
-        if position.direction == "YES" and current_zscore > self.exit_zscore_threshold:
-            return f"over_correction (Z={current_zscore:.2f})"
-        
-        if position.time_to_expiry <= self.force_exit_before_expiry:
-            return f"time_expiry ({position.time_to_expiry}s left)"
-        
-        if position.time_to_expiry <= 0:
+        if code == EXIT_MARKET_CLOSED:
             return "market_closed"
-        
-        return None
+        return f"time_expiry ({time_to_expiry}s left)"
     
-    async def process_exits(self, get_zscore_func) -> List[tuple]:
-        closed = []
-        
-        for position in list(self._positions.values()):
-            try:
-                current_zscore = get_zscore_func(position.asset)
-                exit_reason = self.check_exit_conditions(position, current_zscore)
-                
-                if exit_reason:
-                    result = self.close_position(position, exit_reason)
-                    closed.append((position, exit_reason, result))
-                    
-            except Exception as e:
-                logger.error(f"Error processing paper exit: {e}")
+    async def _close_exits(self, exits: List[tuple]) -> List[tuple]:
+        """Close all exiting positions in one engine batch."""
+        try:
+            results = self.engine.batch_close(exits)
+        except Exception as e:
+            logger.error("Error processing paper exits: %s", e)
+            return []
         
+        closed = []
+        for (position, exit_reason), result in zip(exits, results):
+            self._remove_position(position)
+            closed.append((position, exit_reason, result))
         return closed
     
     def get_status(self) -> Dict:
+        stats = self.engine.get_statistics()
         return {
             "mode": "PAPER TRADING",
             "balance": self.engine.balance,
-            "open_positions": self.position_count,
-            "max_positions": self.max_positions,
-            "total_trades": self.engine._total_trades,
-            "total_pnl": self.engine._total_pnl,
-            "positions": [
-                {
-                    "id": p.position_id,
-                    "asset": p.asset,
-                    "direction": p.direction,
-                    "shares": p.shares,
-                    "age_seconds": p.age_seconds
-                }
-                for p in self._positions.values()
-            ]
+            "total_trades": stats["total_trades"],
+            "total_pnl": stats["total_pnl"],
+            **super().get_status()
         }
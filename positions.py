@@ -4,26 +4,45 @@ PolyGraalX Position Manager Module
 Tracks open positions and manages exit conditions.
 """
 
+import asyncio
 import logging
+import time
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, Optional, List
+from typing import Any, Callable, Dict, Optional, List
+
+import numpy as np
 
 from market_discovery import Market
 from trading import TradingEngine, OrderResult
-from volatility import Signal
+from volatility import (
+    Direction, Signal, exit_reason_codes,
+    EXIT_MEAN_REVERSION, EXIT_OVER_CORRECTION, EXIT_TIME_EXPIRY, EXIT_MARKET_CLOSED,
+)
 
 logger = logging.getLogger(__name__)
 
+# Batch Z-Score provider: array of asset names -> array of Z-Scores (same order)
+BatchZScoreFunc = Callable[[np.ndarray], np.ndarray]
+
+# Hot exit-check columns, one row per position slot (struct-of-arrays)
+HOT_DTYPE = np.dtype([
+    ("sign", np.int8),          # direction_sign
+    ("expiry_ts", np.float64),  # market end time, Unix seconds
+    ("entry_ts", np.float64),   # position open time, Unix seconds
+    ("alive", np.bool_),
+])
 
-@dataclass
+
+@dataclass(slots=True)
 class Position:
     """Represents an open trading position."""
     
     position_id: str
     market: Market
     token_id: str
-    direction: str          # "YES" or "NO"
+    direction: Direction    # YES or NO ("YES"/"NO" accepted)
     entry_price: float
     shares: float
     amount_usdc: float
@@ -31,22 +50,41 @@ class Position:
     entry_signal: Signal
     entry_time: datetime
     order_id: Optional[str] = None
+    direction_sign: int = field(init=False, repr=False)  # +1 YES, -1 NO
+    slot: int = field(default=-1, init=False, repr=False)  # Row in the manager's hot block
+    asset: str = field(init=False, repr=False)             # Snapshot of market.asset
+    strike_price: float = field(init=False, repr=False)    # Snapshot of market.strike_price
+    expiry_ts: float = field(init=False, repr=False)       # Snapshot of market end time (Unix)
+    entry_monotonic: float = field(default_factory=time.monotonic, repr=False)  # For age
     
-    @property
-    def asset(self) -> str:
-        """Asset this position is for."""
-        return self.market.asset
+    def __post_init__(self):
+        self.direction = Direction.coerce(self.direction)
+        self.direction_sign = int(self.direction)
+        self.asset = self.market.asset
+        self.strike_price = self.market.strike_price
+        self.expiry_ts = self.market.end_time_epoch
+    
+    def age_seconds_at(self, now: datetime) -> int:
+        """Seconds between opening and a wall-clock time (for reporting)."""
+        return int((now - self.entry_time).total_seconds())
+    
+    def age_seconds_from(self, now_monotonic: float) -> int:
+        """Seconds since opening, relative to a time.monotonic() reading."""
+        return int(now_monotonic - self.entry_monotonic)
     
     @property
     def age_seconds(self) -> int:
         """Seconds since position was opened."""
-        delta = datetime.now(timezone.utc) - self.entry_time
-        return int(delta.total_seconds())
+        return int(time.monotonic() - self.entry_monotonic)
+    
+    def time_to_expiry_at(self, now_ts: float) -> int:
+        """Seconds until market expires, relative to a Unix timestamp."""
+        return max(0, int(self.expiry_ts - now_ts))
     
     @property
     def time_to_expiry(self) -> int:
         """Seconds until market expires."""
-        return self.market.seconds_to_expiry
+        return self.time_to_expiry_at(time.time())
     
     def __repr__(self) -> str:
         return (
@@ -56,7 +94,7 @@ class Position:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ExitReason:
     """Reason for closing a position."""
     
@@ -66,19 +104,21 @@ class ExitReason:
     pnl_estimate: Optional[float] = None
 
 
-class PositionManager:
+class BasePositionManager:
     """
-    Manages open positions and exit conditions.
+    Position bookkeeping and exit evaluation shared by the live and paper managers.
     
-    Exit conditions:
-    1. Mean reversion: Z-Score returns to neutral (±0.5)
-    2. Time-based: Force exit 2 minutes before market expiry
-    3. Market close: Exit when market resolves
+    Keeps open positions (by id and by asset), the struct-of-arrays hot block
+    used by the exit pass, and the exit checks themselves. Subclasses supply
+    open_position/close_position for their engine and _exit_reason for
+    their reason type.
     """
     
+    id_prefix = "pos"
+    
     def __init__(
         self,
-        trading_engine: TradingEngine,
+        trading_engine,
         max_positions: int = 2,
         exit_zscore_threshold: float = 0.5,
         force_exit_before_expiry: int = 120
@@ -95,25 +135,68 @@ class PositionManager:
         self.exit_zscore_threshold = exit_zscore_threshold
         self.force_exit_before_expiry = force_exit_before_expiry
         
-        # Open positions: position_id -> Position
-        self._positions: Dict[str, Position] = {}
+        # Executor for blocking engine calls (None: the event loop's default)
+        self.executor: Optional[Executor] = None
         
-        # Losing streak protection (same as paper trading)
-        self._consecutive_losses = 0
-        self._max_consecutive_losses = 5  # Stop after 5 losses in a row
-        self._should_stop = False
+        # Open positions: position_id -> position
+        self._positions: Dict[str, Any] = {}
+        # Secondary index: asset -> position_id
+        self._asset_to_pid: Dict[str, str] = {}
+        # Hot exit-check block: row per slot, position objects kept alongside
+        self._hot = np.zeros(max_positions, dtype=HOT_DTYPE)
+        self._slot_positions: List[Any] = [None] * max_positions
+        self._free_slots: List[int] = list(range(max_positions - 1, -1, -1))
         
-        # Position counter for ID generation
+        # Position ID generation: session prefix + counter
+        self._id_prefix = f"{self.id_prefix}_{datetime.now(timezone.utc):%Y%m%d%H%M%S}_"
         self._counter = 0
     
     def _generate_position_id(self) -> str:
         """Generate unique position ID."""
         self._counter += 1
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
-        return f"pos_{timestamp}_{self._counter:04d}"
+        return f"{self._id_prefix}{self._counter:04d}"
+    
+    def _claim_slot(self, position) -> None:
+        """Write a newly opened position into a free row of the hot block."""
+        if not self._free_slots:
+            self._grow_hot()
+        slot = self._free_slots.pop()
+        self._hot[slot] = (
+            position.direction_sign,
+            position.expiry_ts,
+            position.entry_time.timestamp(),
+            True
+        )
+        self._slot_positions[slot] = position
+        position.slot = slot
+    
+    def _release_slot(self, position) -> None:
+        slot = position.slot
+        self._hot["alive"][slot] = False
+        self._slot_positions[slot] = None
+        self._free_slots.append(slot)
+    
+    def _grow_hot(self) -> None:
+        size = len(self._hot)
+        new_size = max(1, size * 2)
+        self._hot = np.concatenate((self._hot, np.zeros(new_size - size, dtype=HOT_DTYPE)))
+        self._slot_positions.extend([None] * (new_size - size))
+        self._free_slots.extend(range(new_size - 1, size - 1, -1))
+    
+    def _add_position(self, position) -> None:
+        """Start tracking a newly opened position."""
+        self._positions[position.position_id] = position
+        self._asset_to_pid[position.asset] = position.position_id
+        self._claim_slot(position)
+    
+    def _remove_position(self, position) -> None:
+        """Stop tracking a closed position."""
+        del self._positions[position.position_id]
+        del self._asset_to_pid[position.asset]
+        self._release_slot(position)
     
     @property
-    def open_positions(self) -> List[Position]:
+    def open_positions(self) -> List:
         """Get list of open positions."""
         return list(self._positions.values())
     
@@ -134,23 +217,197 @@ class PositionManager:
         """
         # Check max positions
         if self.position_count >= self.max_positions:
-            logger.debug(f"Max positions reached ({self.max_positions})")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Max positions reached (%d)", self.max_positions)
             return False
         
         # Check if we already have a position in this asset
-        for pos in self._positions.values():
-            if pos.asset == asset:
-                logger.debug(f"Already have position in {asset}")
-                return False
+        if asset in self._asset_to_pid:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Already have position in %s", asset)
+            return False
         
         return True
     
-    def get_position_for_asset(self, asset: str) -> Optional[Position]:
+    def get_position_for_asset(self, asset: str):
         """Get open position for an asset, if any."""
-        for pos in self._positions.values():
-            if pos.asset == asset:
-                return pos
-        return None
+        pid = self._asset_to_pid.get(asset)
+        return self._positions.get(pid) if pid else None
+    
+    def close_position(self, position, reason):
+        """Close an open position (engine-specific)."""
+        raise NotImplementedError
+    
+    def _exit_reason(self, code: int, current_zscore: float, time_to_expiry: int):
+        """Build the subclass's exit reason for an EXIT_* code."""
+        raise NotImplementedError
+    
+    def check_exit_conditions(
+        self,
+        position,
+        current_zscore: float,
+        now_ts: Optional[float] = None
+    ):
+        """
+        Check if position should be closed.
+        
+        Args:
+            position: Position to check
+            current_zscore: Current Z-Score for the asset
+            now_ts: Current Unix timestamp (default: read the clock)
+            
+        Returns:
+            Exit reason if should exit, None otherwise
+        """
+        threshold = self.exit_zscore_threshold
+        time_to_expiry = 0
+        
+        # 1. Mean reversion exit
+        if -threshold <= current_zscore <= threshold:
+            code = EXIT_MEAN_REVERSION
+        
+        # 2. Over-correction exit: price kept moving our way past the threshold
+        # (YES and Z > threshold, or NO and Z < -threshold)
+        elif current_zscore * position.direction_sign > threshold:
+            code = EXIT_OVER_CORRECTION
+        
+        else:
+            time_to_expiry = position.time_to_expiry_at(time.time() if now_ts is None else now_ts)
+            
+            # 3. Market expired
+            if time_to_expiry <= 0:
+                code = EXIT_MARKET_CLOSED
+            
+            # 4. Time-based exit (too close to expiry)
+            elif time_to_expiry <= self.force_exit_before_expiry:
+                code = EXIT_TIME_EXPIRY
+            
+            else:
+                return None
+        
+        return self._exit_reason(code, current_zscore, time_to_expiry)
+    
+    async def process_exits(self, get_zscores_func: BatchZScoreFunc) -> List[tuple]:
+        """
+        Check all positions for exit conditions and close as needed.
+        
+        Conditions are evaluated for every position at once from the hot block
+        (exit_reason_codes); a reason is only built for the positions that
+        actually exit.
+        
+        Args:
+            get_zscores_func: Callable(assets array) -> Z-Score array
+            
+        Returns:
+            List of (position, reason, result) tuples for closed positions
+        """
+        live = np.flatnonzero(self._hot["alive"])
+        if not live.size:
+            return []
+        
+        positions = [self._slot_positions[slot] for slot in live]
+        now_ts = time.time()
+        try:
+            zscores = np.asarray(
+                get_zscores_func(np.array([p.asset for p in positions])),
+                dtype=np.float64
+            )
+            rows = self._hot[live]
+            times_to_expiry = np.maximum(rows["expiry_ts"] - now_ts, 0.0).astype(np.int64)
+            codes = exit_reason_codes(
+                zscores, rows["sign"], times_to_expiry,
+                self.exit_zscore_threshold, self.force_exit_before_expiry
+            )
+        except Exception as e:
+            logger.error("Error evaluating exits: %s", e)
+            return []
+        
+        exit_idx = np.flatnonzero(codes)
+        if not exit_idx.size:
+            return []
+        
+        return await self._close_exits([
+            (positions[i], self._exit_reason(int(codes[i]), float(zscores[i]), int(times_to_expiry[i])))
+            for i in exit_idx
+        ])
+    
+    async def close_all(self, reason: ExitReason) -> List[tuple]:
+        """
+        Close every open position for the same reason (e.g. shutdown).
+        
+        Returns:
+            List of (position, reason, result) tuples for closed positions
+        """
+        exits = [(position, reason) for position in self.open_positions]
+        if not exits:
+            return []
+        return await self._close_exits(exits)
+    
+    async def _close_exits(self, exits: List[tuple]) -> List[tuple]:
+        """Close each (position, reason) pair; returns (position, reason, result) tuples."""
+        closed = []
+        for position, exit_reason in exits:
+            try:
+                result = self.close_position(position, exit_reason)
+                closed.append((position, exit_reason, result))
+            except Exception as e:
+                logger.error("Error processing exit for %s: %s", position.position_id, e)
+        return closed
+    
+    def get_status(self) -> Dict:
+        """Get current position manager status for logging."""
+        now_ts = time.time()
+        now_monotonic = time.monotonic()
+        return {
+            "open_positions": self.position_count,
+            "max_positions": self.max_positions,
+            "positions": [
+                {
+                    "id": p.position_id,
+                    "asset": p.asset,
+                    "strike_price": p.strike_price,
+                    "direction": p.direction.name,
+                    "shares": p.shares,
+                    "age_seconds": p.age_seconds_from(now_monotonic),
+                    "time_to_expiry": p.time_to_expiry_at(now_ts)
+                }
+                for p in self._positions.values()
+            ]
+        }
+
+
+class PositionManager(BasePositionManager):
+    """
+    Manages open positions and exit conditions.
+    
+    Exit conditions:
+    1. Mean reversion: Z-Score returns to neutral (±0.5)
+    2. Time-based: Force exit 2 minutes before market expiry
+    3. Market close: Exit when market resolves
+    """
+    
+    def __init__(
+        self,
+        trading_engine: TradingEngine,
+        max_positions: int = 2,
+        exit_zscore_threshold: float = 0.5,
+        force_exit_before_expiry: int = 120
+    ):
+        """
+        Args:
+            trading_engine: Trading engine for order execution
+            max_positions: Maximum concurrent positions
+            exit_zscore_threshold: Z-Score threshold for mean reversion exit
+            force_exit_before_expiry: Seconds before expiry to force exit
+        """
+        super().__init__(
+            trading_engine, max_positions, exit_zscore_threshold, force_exit_before_expiry
+        )
+        
+        # Losing streak protection (same as paper trading)
+        self._consecutive_losses = 0
+        self._max_consecutive_losses = 5  # Stop after 5 losses in a row
+        self._should_stop = False
     
     def open_position(
         self,
@@ -170,38 +427,48 @@ class PositionManager:
             Position object if successful
         """
         if not order_result.success:
-            logger.error(f"Cannot open position - order failed: {order_result.error}")
+            logger.error("Cannot open position - order failed: %s", order_result.error)
             return None
         
+        now = datetime.now(timezone.utc)
         position_id = self._generate_position_id()
+        direction = Direction.coerce(signal.direction)
         
         token_id = (
-            market.token_id_yes if signal.direction == "YES" 
+            market.token_id_yes if direction == Direction.YES
             else market.token_id_no
         )
         
-        # Estimate shares from amount (simplified)
-        # In reality, we'd get this from the order execution
-        entry_price = self.engine.get_midpoint(token_id) or 0.5
-        shares = order_result.amount_spent / entry_price if entry_price > 0 else 0
+        # The fill price (or its midpoint estimate) comes with the order
+        # result, fetched off the event loop; never query the CLOB from here
+        entry_price = order_result.avg_price
+        if not entry_price:
+            logger.warning(
+                "No fill price for order %s on %s, recording entry at 0.5",
+                order_result.order_id, market.asset
+            )
+            entry_price = 0.5
+        shares = order_result.shares or (
+            order_result.amount_spent / entry_price if entry_price > 0 else 0
+        )
         
         position = Position(
             position_id=position_id,
             market=market,
             token_id=token_id,
-            direction=signal.direction,
+            direction=direction,
             entry_price=entry_price,
             shares=shares,
             amount_usdc=order_result.amount_spent,
             entry_zscore=signal.zscore,
             entry_signal=signal,
-            entry_time=datetime.now(timezone.utc),
+            entry_time=now,
             order_id=order_result.order_id
         )
         
-        self._positions[position_id] = position
+        self._add_position(position)
         
-        logger.info(f"Opened position: {position}")
+        logger.info("Opened position: %s", position)
         return position
     
     def close_position(
@@ -219,14 +486,51 @@ class PositionManager:
         Returns:
             OrderResult from sell order
         """
-        logger.info(f"Closing position {position.position_id}: {reason.description}")
+        logger.info("Closing position %s: %s", position.position_id, reason.description)
         
         # Place sell order
         result = self.engine.sell_position(
             token_id=position.token_id,
             shares=position.shares
         )
+        self._settle_close(position, result)
+        return result
+    
+    async def _close_exits(self, exits: List[tuple]) -> List[tuple]:
+        """
+        Sell all exiting positions in one CLOB batch, off the event loop.
+        
+        The blocking sell runs on self.executor; PnL, streak and index
+        bookkeeping then happen back on the loop in exit order.
+        """
+        loop = asyncio.get_running_loop()
+        for position, exit_reason in exits:
+            logger.info("Closing position %s: %s", position.position_id, exit_reason.description)
         
+        try:
+            if len(exits) == 1:
+                position = exits[0][0]
+                results = [await loop.run_in_executor(
+                    self.executor, self.engine.sell_position, position.token_id, position.shares
+                )]
+            else:
+                results = await loop.run_in_executor(
+                    self.executor,
+                    self.engine.sell_positions_batch,
+                    [(position.token_id, position.shares) for position, _ in exits]
+                )
+        except Exception as e:
+            logger.error("Error processing exits: %s", e)
+            return []
+        
+        closed = []
+        for (position, exit_reason), result in zip(exits, results):
+            self._settle_close(position, result)
+            closed.append((position, exit_reason, result))
+        return closed
+    
+    def _settle_close(self, position: Position, result: OrderResult) -> None:
+        """Apply a sell result: PnL and streak tracking, then drop the position."""
         if result.success:
             # Calculate PnL
             proceeds = result.shares * result.avg_price
@@ -236,135 +540,55 @@ class PositionManager:
             # Track winning/losing streak
             if pnl >= 0:
                 self._consecutive_losses = 0  # Reset losing streak
-                logger.info(f"✅ Position profitable: ${pnl:+.2f}")
+                logger.info("✅ Position profitable: $%+.2f", pnl)
             else:
                 self._consecutive_losses += 1
-                logger.warning(f"❌ Position loss: ${pnl:+.2f}")
+                logger.warning("❌ Position loss: $%+.2f", pnl)
                 
                 # Check if we hit max consecutive losses
                 if self._consecutive_losses >= self._max_consecutive_losses:
                     self._should_stop = True
                     logger.critical(
-                        f"🛑 STOP FORCÉ: {self._consecutive_losses} trades perdants consécutifs! "
-                        f"Le bot va s'arrêter par sécurité."
+                        "🛑 STOP FORCÉ: %d trades perdants consécutifs! "
+                        "Le bot va s'arrêter par sécurité.",
+                        self._consecutive_losses
                     )
                 # Warn about losing streak
                 elif self._consecutive_losses >= 3:
                     logger.warning(
-                        f"⚠️ Attention: {self._consecutive_losses} pertes consécutives "
-                        f"({self._max_consecutive_losses - self._consecutive_losses} avant arrêt forcé)"
+                        "⚠️ Attention: %d pertes consécutives (%d avant arrêt forcé)",
+                        self._consecutive_losses,
+                        self._max_consecutive_losses - self._consecutive_losses
                     )
             
             # Remove from open positions
-            del self._positions[position.position_id]
-            logger.info(f"Position closed successfully: {position.position_id}")
+            self._remove_position(position)
+            logger.info("Position closed successfully: %s", position.position_id)
         else:
-            logger.error(f"Failed to close position: {result.error}")
-        
-        return result
+            logger.error("Failed to close position: %s", result.error)
     
-    def check_exit_conditions(
-        self,
-        position: Position,
-        current_zscore: float
-    ) -> Optional[ExitReason]:
-        """
-        Check if position should be closed.
-        
-        Args:
-            position: Position to check
-            current_zscore: Current Z-Score for the asset
-            
-        Returns:
-            ExitReason if should exit, None otherwise
-        """
-        # 1. Mean reversion exit
-        if abs(current_zscore) <= self.exit_zscore_threshold:
+    def _exit_reason(self, code: int, current_zscore: float, time_to_expiry: int) -> ExitReason:
+        """Build the ExitReason for an EXIT_* code."""
+        if code == EXIT_MEAN_REVERSION:
             return ExitReason(
                 code="mean_reversion",
                 description=f"Z-Score normalized to {current_zscore:.2f}",
                 current_zscore=current_zscore
             )
-        
-        # 2. Over-correction exit
-        # If we bet NO (expecting price to drop), but price dropped further
-        if position.direction == "NO" and current_zscore < -self.exit_zscore_threshold:
+        if code == EXIT_OVER_CORRECTION:
             return ExitReason(
                 code="mean_reversion",
                 description=f"Price over-corrected (Z={current_zscore:.2f})",
                 current_zscore=current_zscore
             )
-        
-        # If we bet YES (expecting price to rise), but price rose further
-        if position.direction == "YES" and current_zscore > self.exit_zscore_threshold:
-            return ExitReason(
-                code="mean_reversion",
-                description=f"Price over-corrected (Z={current_zscore:.2f})",
-                current_zscore=current_zscore
-            )
-        
-        # 3. Time-based exit (too close to expiry)
-        if position.time_to_expiry <= self.force_exit_before_expiry:
-            return ExitReason(
-                code="time_expiry",
-                description=f"Only {position.time_to_expiry}s until market expiry",
-                current_zscore=current_zscore
-            )
-        
-        # 4. Market expired
-        if position.time_to_expiry <= 0:
+        if code == EXIT_MARKET_CLOSED:
             return ExitReason(
                 code="market_closed",
                 description="Market has expired",
                 current_zscore=current_zscore
             )
-        
-        return None
-    
-    async def process_exits(
-        self,
-        get_zscore_func
-    ) -> List[tuple[Position, ExitReason, OrderResult]]:
-        """
-        Check all positions for exit conditions and close as needed.
-        
-        Args:
-            get_zscore_func: Callable(asset) -> float to get current Z-Score
-            
-        Returns:
-            List of (position, reason, result) tuples for closed positions
-        """
-        closed = []
-        
-        for position in list(self._positions.values()):
-            try:
-                current_zscore = get_zscore_func(position.asset)
-                
-                exit_reason = self.check_exit_conditions(position, current_zscore)
-                
-                if exit_reason:
-                    result = self.close_position(position, exit_reason)
-                    closed.append((position, exit_reason, result))
-                    
-            except Exception as e:
-                logger.error(f"Error processing exit for {position.position_id}: {e}")
-        
-        return closed
-    
-    def get_status(self) -> Dict:
-        """Get current position manager status for logging."""
-        return {
-            "open_positions": self.position_count,
-            "max_positions": self.max_positions,
-            "positions": [
-                {
-                    "id": p.position_id,
-                    "asset": p.asset,
-                    "direction": p.direction,
-                    "shares": p.shares,
-                    "age_seconds": p.age_seconds,
-                    "time_to_expiry": p.time_to_expiry
-                }
-                for p in self._positions.values()
-            ]
-        }
+        return ExitReason(
+            code="time_expiry",
+            description=f"Only {time_to_expiry}s until market expiry",
+            current_zscore=current_zscore
+        )
@@ -6,63 +6,290 @@ for volatility calculations.
 """
 
 import asyncio
+import inspect
+import json
 import logging
-from collections import deque
+import math
+import ssl
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, AsyncIterator, Awaitable
 
+import aiohttp
 import ccxt.pro as ccxtpro
+import numpy as np
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # Optional dependency: fall back to the stdlib parser
+    from json import loads as _json_loads
 
 logger = logging.getLogger(__name__)
 
+# Sample cap per window second (bounds memory during trade bursts)
+MAX_SAMPLES_PER_SECOND = 500
 
-@dataclass
-class PricePoint:
-    """Single price observation."""
-    price: float
-    timestamp: datetime
-    symbol: str
+# Appends between eviction passes (reads always evict first)
+EVICT_EVERY = 32
+
+# Asset -> tracked trading pair (other assets map to "<ASSET>/USDT")
+_ASSET_TO_SYMBOL = {
+    "BTC": "BTC/USDT",
+    "ETH": "ETH/USDT"
+}
+
+# Stream watchdog: check every WATCHDOG_INTERVAL seconds, reconnect after
+# STREAM_STALE_AFTER seconds without a frame
+WATCHDOG_INTERVAL = 5
+STREAM_STALE_AFTER = 30
 
+# Seconds to wait for the peer's close frame (a stale stream may never send it)
+WS_CLOSE_TIMEOUT = 2
 
-@dataclass
+# Minimum seconds between repeated logs of the same callback error
+CALLBACK_ERROR_LOG_INTERVAL = 5.0
+
+# Binance combined raw-trade stream (append "btcusdt@trade/ethusdt@trade")
+BINANCE_STREAM_URL = "wss://stream.binance.com:9443/stream?streams="
+
+
+@dataclass(slots=True)
 class PriceWindow:
-    """Rolling window of price observations for an asset."""
+    """
+    Rolling window of price observations for an asset.
+    
+    Prices and epoch timestamps live in preallocated NumPy buffers. New samples
+    are appended at the tail and expired ones dropped by advancing the head, so
+    the live window is always one contiguous slice. Running sums (shifted by a
+    reference price to keep float precision) give O(1) mean and std.
+    
+    Expired samples are evicted in one pass every EVICT_EVERY adds, and before
+    any read, so readers always see exactly the last window_seconds. At most
+    max_samples are kept: beyond that the oldest sample is dropped on each
+    add, like a deque with maxlen.
+    """
     
     symbol: str
     window_seconds: int = 60
-    prices: deque = field(default_factory=deque)
+    capacity: int = 4096
+    max_samples: int = 0  # 0: window_seconds * MAX_SAMPLES_PER_SECOND
     current_price: float = 0.0
-    last_update: Optional[datetime] = None
+    last_update: Optional[float] = None  # Epoch seconds of the latest sample
+    
+    _prices: np.ndarray = field(init=False, repr=False)
+    _times: np.ndarray = field(init=False, repr=False)
+    _head: int = field(default=0, init=False, repr=False)
+    _tail: int = field(default=0, init=False, repr=False)
+    _head_ts: float = field(default=0.0, init=False, repr=False)  # Timestamp of oldest sample
+    _ref: float = field(default=0.0, init=False, repr=False)
+    _sum: float = field(default=0.0, init=False, repr=False)
+    _sum_sq: float = field(default=0.0, init=False, repr=False)
+    _pending: int = field(default=0, init=False, repr=False)  # Adds since last eviction pass
+    _view: Optional[np.ndarray] = field(default=None, init=False, repr=False)  # Cached get_prices()
+    _view_span: tuple = field(default=(0, 0), init=False, repr=False)
     
-    def add(self, price: float, timestamp: Optional[datetime] = None) -> None:
-        """Add a new price observation."""
-        if timestamp is None:
-            timestamp = datetime.now(timezone.utc)
+    def __post_init__(self) -> None:
+        if self.max_samples <= 0:
+            self.max_samples = self.window_seconds * MAX_SAMPLES_PER_SECOND
+        self._prices = np.empty(self.capacity, dtype=np.float64)
+        self._times = np.empty(self.capacity, dtype=np.float64)
+    
+    def add(self, price: float, ts: Optional[float] = None) -> None:
+        """Add a new price observation (ts: epoch seconds, default now)."""
+        if ts is None:
+            ts = time.time()
+        
+        if self._tail == self._head:
+            # Empty window: re-anchor the running sums on this price
+            self._head = self._tail = 0
+            self._head_ts = ts
+            self._ref = price
+            self._sum = self._sum_sq = 0.0
+        elif self._tail == self.capacity:
+            self._trim()
+            self._compact()
+        
+        self._prices[self._tail] = price
+        self._times[self._tail] = ts
+        self._tail += 1
+        
+        delta = price - self._ref
+        self._sum += delta
+        self._sum_sq += delta * delta
         
         self.current_price = price
-        self.last_update = timestamp
+        self.last_update = ts
+        
+        # Expired samples are dropped in batches every EVICT_EVERY adds (or
+        # on the next read); the sample cap is still enforced on every add
+        self._pending += 1
+        if self._pending >= EVICT_EVERY or self._tail - self._head > self.max_samples:
+            self._trim()
+    
+    def add_batch(self, prices: np.ndarray, ts: np.ndarray) -> None:
+        """
+        Add several observations at once (ts: epoch seconds, oldest first).
+        
+        Equivalent to calling add() for each sample, but copies the batch into
+        the buffer in one go and runs eviction once.
+        """
+        n = len(prices)
+        if n == 0:
+            return
+        if n > self.max_samples:
+            prices, ts = prices[-self.max_samples:], ts[-self.max_samples:]
+            n = self.max_samples
+        
+        if self._tail == self._head:
+            self._head = self._tail = 0
+            self._head_ts = float(ts[0])
+            self._ref = float(prices[0])
+            self._sum = self._sum_sq = 0.0
+        if self._tail + n > self.capacity:
+            if self._pending:
+                self._trim()
+            self._compact(n)
+        
+        start, end = self._tail, self._tail + n
+        np.copyto(self._prices[start:end], prices)
+        np.copyto(self._times[start:end], ts)
+        self._tail = end
+        
+        deltas = self._prices[start:end] - self._ref
+        self._sum += float(deltas.sum())
+        self._sum_sq += float(np.dot(deltas, deltas))
+        
+        last_ts = float(self._times[end - 1])
+        self.current_price = float(self._prices[end - 1])
+        self.last_update = last_ts
+        
+        self._trim()
+    
+    def _trim(self) -> None:
+        """Evict samples that fell out of the window as of the latest one."""
+        self._pending = 0
+        cutoff = self.last_update - self.window_seconds
+        if self._head_ts < cutoff or self._tail - self._head > self.max_samples:
+            self._evict(cutoff)
+    
+    def _evict(self, cutoff: float) -> None:
+        """Drop samples older than cutoff, and the oldest ones beyond max_samples."""
+        head, tail = self._head, self._tail
+        times = self._times
+        
+        # Samples arrive in time order: when more than the head has expired
+        # (e.g. after a pause), binary-search the first one still in the window
+        if head + 1 < tail and times[head + 1] < cutoff:
+            new_head = head + int(np.searchsorted(times[head:tail], cutoff, side="left"))
+        else:
+            new_head = head + 1 if times[head] < cutoff else head
+        new_head = max(new_head, tail - self.max_samples)
         
-        point = PricePoint(price=price, timestamp=timestamp, symbol=self.symbol)
-        self.prices.append(point)
+        if new_head == head + 1:
+            delta = self._prices[head] - self._ref
+            self._sum -= delta
+            self._sum_sq -= delta * delta
+        elif new_head > head:
+            deltas = self._prices[head:new_head] - self._ref
+            self._sum -= float(deltas.sum())
+            self._sum_sq -= float(np.dot(deltas, deltas))
         
-        # Remove old observations outside the window
-        cutoff = timestamp.timestamp() - self.window_seconds
-        while self.prices and self.prices[0].timestamp.timestamp() < cutoff:
-            self.prices.popleft()
+        self._head = new_head
+        self._head_ts = float(times[new_head])  # add() just appended, so new_head < tail
     
-    def get_prices(self) -> List[float]:
-        """Get list of prices in the window."""
-        return [p.price for p in self.prices]
+    def _compact(self, incoming: int = 1) -> None:
+        """Move live samples to the buffer start, growing it if mostly full."""
+        live = self._tail - self._head
+        capacity = self.capacity
+        while live > capacity // 2 or live + incoming > capacity:
+            capacity *= 2
+        if capacity != self.capacity:
+            self.capacity = capacity
+            prices = np.empty(capacity, dtype=np.float64)
+            times = np.empty(capacity, dtype=np.float64)
+        else:
+            prices, times = self._prices, self._times
+        
+        prices[:live] = self._prices[self._head:self._tail]
+        times[:live] = self._times[self._head:self._tail]
+        self._prices, self._times = prices, times
+        self._head, self._tail = 0, live
+        self._view = None
+        if live == 0:
+            return
+        self._head_ts = float(times[0])
+        
+        # Resync running sums exactly to shed accumulated float drift
+        self._ref = float(prices[live - 1])
+        deltas = prices[:live] - self._ref
+        self._sum = float(deltas.sum())
+        self._sum_sq = float(np.dot(deltas, deltas))
+    
+    @property
+    def last_update_dt(self) -> Optional[datetime]:
+        """Time of the latest sample as a UTC datetime."""
+        if self.last_update is None:
+            return None
+        return datetime.fromtimestamp(self.last_update, tz=timezone.utc)
+    
+    def get_prices(self) -> np.ndarray:
+        """
+        Get prices in the window, oldest first.
+        
+        Returns a read-only view into the buffer; it is only valid until the
+        next call to add().
+        """
+        if self._pending:
+            self._trim()
+        span = (self._head, self._tail)
+        if self._view is None or self._view_span != span:
+            self._view = self._prices[self._head:self._tail]
+            self._view.flags.writeable = False
+            self._view_span = span
+        return self._view
+    
+    @property
+    def mean(self) -> float:
+        """Mean price over the window (0 if empty)."""
+        if self._pending:
+            self._trim()
+        n = self._tail - self._head
+        if n == 0:
+            return 0.0
+        return self._ref + self._sum / n
+    
+    @property
+    def std(self) -> float:
+        """Population standard deviation over the window (0 if empty)."""
+        if self._pending:
+            self._trim()
+        n = self._tail - self._head
+        if n == 0:
+            return 0.0
+        avg = self._sum / n
+        return math.sqrt(max(self._sum_sq / n - avg * avg, 0.0))
     
     def is_ready(self, min_samples: int = 30) -> bool:
         """Check if we have enough samples for calculations."""
-        return len(self.prices) >= min_samples
+        if self._pending:
+            self._trim()
+        return self._tail - self._head >= min_samples
     
     @property
     def sample_count(self) -> int:
         """Number of samples in the window."""
-        return len(self.prices)
+        if self._pending:
+            self._trim()
+        return self._tail - self._head
+
+
+def _unverified_ssl_context() -> ssl.SSLContext:
+    """SSL context that doesn't verify certificates."""
+    ssl_context = ssl.create_default_context()
+    ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl.CERT_NONE
+    return ssl_context
 
 
 class PriceFeed:
@@ -73,21 +300,38 @@ class PriceFeed:
     with configurable window sizes.
     """
     
+    # Built once and shared by every HTTP session the feed opens
+    _ssl_context: ssl.SSLContext = _unverified_ssl_context()
+    
     def __init__(
         self,
         symbols: Optional[List[str]] = None,
-        window_seconds: int = 60
+        window_seconds: int = 60,
+        use_ccxt: bool = False
     ):
         """
         Args:
             symbols: Trading pairs to track (default: BTC/USDT, ETH/USDT)
             window_seconds: Rolling window size in seconds
+            use_ccxt: Stream trades through ccxt.pro instead of Binance's
+                native combined stream
         """
         if symbols is None:
             symbols = ["BTC/USDT", "ETH/USDT"]
         
         self.symbols = symbols
         self.window_seconds = window_seconds
+        self.use_ccxt = use_ccxt
+        
+        # Binance symbol (BTCUSDT) -> feed symbol (BTC/USDT), the prebuilt
+        # ?symbols= value for the batched ticker endpoint, and the combined
+        # trade stream URL
+        self._binance_symbols: Dict[str, str] = {s.replace("/", ""): s for s in symbols}
+        self._to_binance: Dict[str, str] = {s: b for b, s in self._binance_symbols.items()}
+        self._rest_symbols_param = json.dumps(list(self._binance_symbols), separators=(",", ":"))
+        self._stream_url = BINANCE_STREAM_URL + "/".join(
+            f"{symbol.lower()}@trade" for symbol in self._binance_symbols
+        )
         
         # Price windows per symbol
         self.windows: Dict[str, PriceWindow] = {
@@ -97,14 +341,19 @@ class PriceFeed:
         
         # Exchange connection
         self._exchange: Optional[ccxtpro.binance] = None
+        self._http_session: Optional[aiohttp.ClientSession] = None  # REST fallback
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._last_rx: float = 0.0  # Monotonic time of the last stream frame
         self._connected = False
         
         # Flag to suppress repeated connection errors
         self._api_unreachable: bool = False
         self._last_error_time: float = 0
         
-        # Callbacks for price updates
-        self._callbacks: List[Callable[[str, float], Any]] = []
+        # Callbacks for price updates, split once so notifying needs no type checks
+        self._sync_callbacks: List[Callable[[Dict[str, float]], Any]] = []
+        self._async_callbacks: List[Callable[[Dict[str, float]], Awaitable[Any]]] = []
+        self._callback_errors: Dict[tuple, float] = {}  # (callback id, error type) -> last logged
     
     def _get_exchange(self) -> ccxtpro.binance:
         """Get or create exchange connection."""
@@ -117,31 +366,72 @@ class PriceFeed:
             })
         return self._exchange
     
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Get or create the keep-alive HTTP session used by the REST fallback."""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ssl=self._ssl_context, limit=4),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._http_session
+    
     async def close(self) -> None:
-        """Close exchange connection."""
+        """Close exchange connection and REST session."""
         if self._exchange:
             await self._exchange.close()
             self._exchange = None
+        if self._http_session and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
         self._connected = False
     
-    def add_callback(self, callback: Callable[[str, float], Any]) -> None:
+    def add_callback(self, callback: Callable[[Dict[str, float]], Any]) -> None:
         """
         Register a callback for price updates.
         
         Args:
-            callback: Function(symbol, price) called on each update
+            callback: Function or coroutine function({symbol: price}) called
+                once per batch of updates with the latest price per symbol
         """
-        self._callbacks.append(callback)
+        if inspect.iscoroutinefunction(callback):
+            self._async_callbacks.append(callback)
+        else:
+            self._sync_callbacks.append(callback)
     
-    async def _notify_callbacks(self, symbol: str, price: float) -> None:
-        """Notify all registered callbacks of a price update."""
-        for callback in self._callbacks:
+    async def _notify_callbacks_batch(self, updates: Dict[str, float]) -> None:
+        """Notify all registered callbacks of a batch of price updates."""
+        if not updates:
+            return
+        for callback in self._sync_callbacks:
             try:
-                result = callback(symbol, price)
-                if asyncio.iscoroutine(result):
-                    await result
+                callback(updates)
             except Exception as e:
-                logger.error(f"Callback error: {e}")
+                self._log_callback_error(callback, e)
+        if len(self._async_callbacks) == 1:
+            # A lone coroutine is awaited in place: gather would wrap it in a Task
+            try:
+                await self._async_callbacks[0](updates)
+            except Exception as e:
+                self._log_callback_error(self._async_callbacks[0], e)
+        elif self._async_callbacks:
+            results = await asyncio.gather(
+                *(callback(updates) for callback in self._async_callbacks),
+                return_exceptions=True
+            )
+            for callback, result in zip(self._async_callbacks, results):
+                if isinstance(result, Exception):
+                    self._log_callback_error(callback, result)
+    
+    def _log_callback_error(self, callback: Callable, error: Exception) -> None:
+        """Log a callback error, at most once per interval per callback and error type."""
+        key = (id(callback), type(error))
+        now = time.monotonic()
+        if now - self._callback_errors.get(key, -CALLBACK_ERROR_LOG_INTERVAL) < CALLBACK_ERROR_LOG_INTERVAL:
+            return
+        if len(self._callback_errors) >= 256:
+            self._callback_errors.clear()
+        self._callback_errors[key] = now
+        logger.error(f"Callback error: {error}")
     
     def get_window(self, asset: str) -> Optional[PriceWindow]:
         """
@@ -154,11 +444,8 @@ class PriceFeed:
             PriceWindow or None
         """
         # Convert asset to symbol
-        symbol_map = {
-            "BTC": "BTC/USDT",
-            "ETH": "ETH/USDT"
-        }
-        symbol = symbol_map.get(asset.upper(), f"{asset.upper()}/USDT")
+        key = asset.upper()
+        symbol = _ASSET_TO_SYMBOL.get(key) or f"{key}/USDT"
         return self.windows.get(symbol)
     
     def get_current_price(self, asset: str) -> Optional[float]:
@@ -168,6 +455,40 @@ class PriceFeed:
             return window.current_price
         return None
     
+    def _ingest_trades(self, trades: List[dict]) -> Dict[str, float]:
+        """
+        Add a frame of trades to the price windows, one batch per symbol.
+        
+        Args:
+            trades: ccxt trade dicts, oldest first
+            
+        Returns:
+            Latest price per updated symbol
+        """
+        by_symbol: Dict[str, tuple] = {}
+        for trade in trades:
+            batch = by_symbol.get(trade['symbol'])
+            if batch is None:
+                batch = by_symbol[trade['symbol']] = ([], [])
+            batch[0].append(trade['price'])
+            batch[1].append(trade['timestamp'])
+        
+        updates: Dict[str, float] = {}
+        for symbol, (prices, stamps) in by_symbol.items():
+            window = self.windows.get(symbol)
+            if window is None:
+                continue
+            # Exchange timestamps are epoch ms
+            if len(prices) == 1:
+                window.add(prices[0], stamps[0] * 1e-3)
+            else:
+                window.add_batch(
+                    np.asarray(prices, dtype=np.float64),
+                    np.asarray(stamps, dtype=np.float64) * 1e-3
+                )
+            updates[symbol] = window.current_price
+        return updates
+    
     async def _fetch_price_rest(self, symbol: str) -> Optional[float]:
         """
         Fallback: Fetch price via REST API when WebSocket fails.
@@ -178,30 +499,76 @@ class PriceFeed:
         Returns:
             Current price or None
         """
-        import aiohttp
-        import ssl
-        
         # Convert symbol format: BTC/USDT -> BTCUSDT
-        binance_symbol = symbol.replace("/", "")
+        binance_symbol = self._to_binance.get(symbol) or symbol.replace("/", "")
         url = f"https://api.binance.com/api/v3/ticker/price?symbol={binance_symbol}"
         
         try:
-            # Create SSL context that doesn't verify certificates
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            
-            connector = aiohttp.TCPConnector(ssl=ssl_context)
-            async with aiohttp.ClientSession(connector=connector) as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return float(data.get("price", 0))
-        except Exception as e:
+            async with self._get_http_session().get(url) as response:
+                if response.status != 200:
+                    logger.debug(f"REST fallback for {symbol} returned HTTP {response.status}")
+                    return None
+                data = _json_loads(await response.read())
+                return float(data.get("price", 0))
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
             logger.debug(f"REST fallback failed for {symbol}: {e}")
         
         return None
     
+    async def _fetch_prices_rest(self) -> Dict[str, float]:
+        """
+        Fallback: Fetch all tracked prices in one batched REST request.
+        
+        Binance rejects the whole batch (HTTP 400) if any symbol is unknown;
+        the symbols are then fetched individually, concurrently.
+        
+        Returns:
+            Price per symbol (empty on failure)
+        """
+        url = "https://api.binance.com/api/v3/ticker/price"
+        prices: Dict[str, float] = {}
+        
+        try:
+            session = self._get_http_session()
+            async with session.get(url, params={"symbols": self._rest_symbols_param}) as response:
+                if response.status == 200:
+                    for item in _json_loads(await response.read()):
+                        symbol = self._binance_symbols.get(item.get("symbol"))
+                        if symbol:
+                            prices[symbol] = float(item.get("price", 0))
+                    return prices
+                logger.debug(f"REST fallback for {self.symbols} returned HTTP {response.status}")
+                rejected = response.status == 400
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            logger.debug(f"REST fallback failed for {self.symbols}: {e}")
+            return prices
+        
+        if rejected:
+            results = await asyncio.gather(
+                *(self._fetch_price_rest(symbol) for symbol in self.symbols)
+            )
+            prices = {
+                symbol: price
+                for symbol, price in zip(self.symbols, results)
+                if price is not None
+            }
+        
+        return prices
+    
+    @staticmethod
+    async def _sleep_or_stop(stop_event: asyncio.Event, delay: float) -> bool:
+        """
+        Sleep for delay seconds, waking early if stop_event is set.
+        
+        Returns:
+            True if stop_event was set
+        """
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=delay)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
     async def _poll_prices_rest(self, stop_event: asyncio.Event) -> None:
         """
         Fallback polling loop using REST API when WebSocket is unavailable.
@@ -210,25 +577,64 @@ class PriceFeed:
         logger.info("📡 Using REST API fallback for price data (polling every 2s)")
         
         while not stop_event.is_set():
+            updates: Dict[str, float] = {}
             success = False
-            for symbol in self.symbols:
-                price = await self._fetch_price_rest(symbol)
-                if price and price > 0:
-                    timestamp = datetime.now(timezone.utc)
-                    if symbol in self.windows:
-                        self.windows[symbol].add(price, timestamp)
-                        await self._notify_callbacks(symbol, price)
+            for symbol, price in (await self._fetch_prices_rest()).items():
+                if price > 0:
+                    window = self.windows.get(symbol)
+                    if window is not None:
+                        window.add(price, time.time())
+                        updates[symbol] = price
                     success = True
+            await self._notify_callbacks_batch(updates)
             
             if success:
                 self._connected = True
                 self._api_unreachable = False
             
             # Poll every 2 seconds
-            try:
-                await asyncio.wait_for(stop_event.wait(), timeout=2)
-            except asyncio.TimeoutError:
-                pass
+            await self._sleep_or_stop(stop_event, 2)
+    
+    async def _ccxt_frames(self, stop_event: asyncio.Event) -> AsyncIterator[Dict[str, float]]:
+        """Yield {symbol: latest price} per frame from ccxt.pro's trade stream."""
+        exchange = self._get_exchange()
+        while not stop_event.is_set():
+            trades = await exchange.watch_trades_for_symbols(self.symbols)
+            yield self._ingest_trades(trades)
+    
+    async def _binance_frames(self, stop_event: asyncio.Event) -> AsyncIterator[Dict[str, float]]:
+        """
+        Yield {symbol: price} per trade from Binance's combined trade stream.
+        
+        Each message carries one raw trade ({"s": "BTCUSDT", "p": "95000.1",
+        "T": <epoch ms>, ...}), parsed directly without ccxt's normalization.
+        """
+        # Binance symbol -> (feed symbol, window), bound once for the per-trade loop
+        targets = {
+            binance_symbol: (symbol, self.windows[symbol])
+            for binance_symbol, symbol in self._binance_symbols.items()
+        }
+        loads = _json_loads
+        text = aiohttp.WSMsgType.TEXT
+        
+        session = self._get_http_session()
+        ws_timeout = aiohttp.ClientWSTimeout(ws_close=WS_CLOSE_TIMEOUT)
+        async with session.ws_connect(self._stream_url, heartbeat=20, timeout=ws_timeout) as ws:
+            self._ws = ws
+            receive = ws.receive
+            while not stop_event.is_set():
+                msg = await receive()
+                if msg.type != text:
+                    raise ConnectionError(f"Binance stream closed ({msg.type.name})")
+                
+                trade = loads(msg.data).get("data") or {}
+                target = targets.get(trade.get("s"))
+                if target is None:
+                    continue
+                symbol, window = target
+                price = float(trade["p"])
+                window.add(price, trade["T"] * 1e-3)
+                yield {symbol: price}
     
     async def stream(self, stop_event: asyncio.Event) -> None:
         """
@@ -238,7 +644,6 @@ class PriceFeed:
         Args:
             stop_event: Event to signal stream termination
         """
-        exchange = self._get_exchange()
         logger.info(f"Starting price feed for: {self.symbols}")
         
         reconnect_delay = 1
@@ -246,61 +651,72 @@ class PriceFeed:
         ws_failure_count = 0
         max_ws_failures = 3  # Switch to REST after 3 failures
         
-        while not stop_event.is_set():
-            # If too many WebSocket failures, switch to REST API
-            if ws_failure_count >= max_ws_failures:
-                logger.warning(f"⚠️ WebSocket failed {ws_failure_count} times, switching to REST API")
-                await self._poll_prices_rest(stop_event)
-                return  # REST loop runs until stop_event
-            
-            try:
-                self._connected = True
-                
-                # Watch trades for all symbols
-                while not stop_event.is_set():
-                    try:
-                        trades = await asyncio.wait_for(
-                            exchange.watch_trades_for_symbols(self.symbols),
-                            timeout=30
-                        )
-                        
-                        for trade in trades:
-                            symbol = trade['symbol']
-                            price = trade['price']
-                            timestamp = datetime.fromtimestamp(
-                                trade['timestamp'] / 1000,
-                                tz=timezone.utc
-                            )
-                            
-                            # Update window
-                            if symbol in self.windows:
-                                self.windows[symbol].add(price, timestamp)
-                                await self._notify_callbacks(symbol, price)
+        watchdog = asyncio.create_task(self._watchdog(stop_event))
+        try:
+            while not stop_event.is_set() and ws_failure_count < max_ws_failures:
+                try:
+                    self._connected = True
+                    self._last_rx = time.monotonic()
+                    
+                    # Watch trades for all symbols
+                    frames = self._ccxt_frames if self.use_ccxt else self._binance_frames
+                    async for updates in frames(stop_event):
+                        self._last_rx = time.monotonic()
+                        await self._notify_callbacks_batch(updates)
                         
                         # Reset on success
                         reconnect_delay = 1
                         ws_failure_count = 0
                         self._api_unreachable = False
-                        
-                    except asyncio.TimeoutError:
-                        logger.debug("Price feed timeout, checking connection...")
-                        continue
-                        
-            except asyncio.CancelledError:
-                logger.info("Price feed cancelled")
-                break
-                
-            except Exception as e:
-                self._connected = False
-                ws_failure_count += 1
-                
-                if ws_failure_count < max_ws_failures:
-                    logger.warning(f"WebSocket error ({ws_failure_count}/{max_ws_failures}): {e}")
-                    logger.info(f"Retrying in {reconnect_delay}s...")
-                    await asyncio.sleep(reconnect_delay)
-                    reconnect_delay = min(reconnect_delay * 2, max_reconnect_delay)
-                    await self.close()
-                # If max failures reached, loop will switch to REST on next iteration
+                    
+                except asyncio.CancelledError:
+                    logger.info("Price feed cancelled")
+                    return
+                    
+                except Exception as e:
+                    self._connected = False
+                    if stop_event.is_set():
+                        break  # The watchdog closed the stream for shutdown
+                    ws_failure_count += 1
+                    
+                    if ws_failure_count < max_ws_failures:
+                        logger.warning(f"WebSocket error ({ws_failure_count}/{max_ws_failures}): {e}")
+                        logger.info(f"Retrying in {reconnect_delay}s...")
+                        if await self._sleep_or_stop(stop_event, reconnect_delay):
+                            break
+                        reconnect_delay = min(reconnect_delay * 2, max_reconnect_delay)
+                        await self.close()
+        finally:
+            watchdog.cancel()
+        
+        # If too many WebSocket failures, switch to REST API
+        if ws_failure_count >= max_ws_failures and not stop_event.is_set():
+            logger.warning(f"⚠️ WebSocket failed {ws_failure_count} times, switching to REST API")
+            await self._poll_prices_rest(stop_event)  # Runs until stop_event
+    
+    async def _watchdog(self, stop_event: asyncio.Event) -> None:
+        """
+        Close the trade stream if it goes quiet, forcing a reconnect.
+        
+        Replaces a per-frame receive timeout: one task checking a timestamp
+        every few seconds. Also closes the stream on stop so a pending
+        receive returns immediately.
+        """
+        while not await self._sleep_or_stop(stop_event, WATCHDOG_INTERVAL):
+            if self._connected and time.monotonic() - self._last_rx > STREAM_STALE_AFTER:
+                logger.warning(f"⚠️ No price updates for {STREAM_STALE_AFTER}s, reconnecting")
+                self._last_rx = time.monotonic()
+                await self._close_stream()
+        await self._close_stream()
+    
+    async def _close_stream(self) -> None:
+        """Close the live trade stream so its pending receive fails."""
+        if self._ws is not None and not self._ws.closed:
+            await self._ws.close()
+        self._ws = None
+        if self.use_ccxt and self._exchange:
+            await self._exchange.close()
+            self._exchange = None
     
     async def test_connection(self, timeout: int = 10) -> bool:
         """
@@ -312,22 +728,22 @@ class PriceFeed:
         Returns:
             True if connection successful
         """
-        exchange = self._get_exchange()
+        frames = (self._ccxt_frames if self.use_ccxt else self._binance_frames)(asyncio.Event())
         
         try:
-            trades = await asyncio.wait_for(
-                exchange.watch_trades(self.symbols[0]),
-                timeout=timeout
-            )
+            updates = await asyncio.wait_for(anext(frames), timeout=timeout)
             
-            if trades:
-                logger.info(f"Connection test passed: {trades[0]['symbol']} @ {trades[0]['price']}")
+            if updates:
+                symbol, price = next(iter(updates.items()))
+                logger.info(f"Connection test passed: {symbol} @ {price}")
                 return True
             
         except asyncio.TimeoutError:
             logger.error("Connection test timed out")
         except Exception as e:
             logger.error(f"Connection test failed: {e}")
+        finally:
+            await frames.aclose()
         
         return False
     
@@ -5,18 +5,422 @@ This module provides real order execution using the Polymarket CLOB SDK (py-clob
 Replaces the stub implementation with actual blockchain interactions.
 """
 
+import functools
+import json
 import logging
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 from py_clob_client.client import ClobClient
-from py_clob_client.clob_types import MarketOrderArgs, OrderType
+from py_clob_client.clob_types import (
+    ApiCreds, CreateOrderOptions, MarketOrderArgs, OrderArgs, OrderType, PostOrdersArgs
+)
+from py_clob_client.exceptions import PolyApiException
+from py_clob_client.config import get_contract_config
+from py_clob_client.order_builder.builder import ROUNDING_CONFIG, OrderBuilder as ClobOrderBuilder
 from py_clob_client.order_builder.constants import BUY, SELL
+from eth_account import Account
+from eth_utils import keccak
+from py_order_utils.builders import OrderBuilder as UtilsOrderBuilder
+from py_order_utils.builders.exception import ValidationException
+from py_order_utils.model import EOA, Order, OrderData, SignedOrder
+from py_order_utils.signer import Signer as UtilsSigner
+from py_order_utils.utils import normalize_address
+
+from volatility import Direction
 
 logger = logging.getLogger(__name__)
 
+# REST midpoints younger than this are served from memory
+MIDPOINT_TTL = 0.25
+MIDPOINT_CACHE_SIZE = 2048
+
+# Derived CLOB API credentials, one owner-only file per signing key and chain
+API_CREDS_DIR = Path.home() / ".polygraalx"
+
+
+class _RateLimiter:
+    """
+    Thread-safe token bucket for CLOB requests.
+    
+    acquire() reserves a slot and sleeps until it is due, so callers on the
+    CLOB thread pool pace themselves inside the server's budget instead of
+    spending a round-trip on a 429.
+    """
+    
+    __slots__ = ('_rate', '_capacity', '_tokens', '_last', '_lock')
+    
+    def __init__(self, rate: float):
+        """
+        Args:
+            rate: Requests per second (also the burst size)
+        """
+        self._rate = rate
+        self._capacity = rate
+        self._tokens = rate
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take one request slot, blocking until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._last) * self._rate)
+            self._last = now
+            self._tokens -= 1
+            wait = -self._tokens / self._rate
+        if wait > 0:
+            time.sleep(wait)
+
+
+# Kept under the CLOB's per-account limits (POST/DELETE and GET pools),
+# shared by every engine since they share one client per wallet
+_WRITE_LIMIT = _RateLimiter(700)
+_READ_LIMIT = _RateLimiter(500)
+
+
+def _word(value) -> bytes:
+    """ABI-encode an integer or hex address as one 32-byte EIP-712 word."""
+    if isinstance(value, str):
+        value = int(value, 16)
+    return value.to_bytes(32, "big")
+
+
+class _PresignedOrderBuilder(UtilsOrderBuilder):
+    """
+    py_order_utils order builder with the constant EIP-712 work done once.
+    
+    py_clob_client builds a new builder, signer and domain struct for every
+    order, re-checksumming addresses and re-hashing the domain and Order type
+    each time. Instances of this class are kept per exchange contract (see
+    _FastClobOrderBuilder), and keep the domain hash, type hash, the encoded
+    maker/signer/taker/tokenId block per token and the parsed key, so an order
+    only encodes its variable fields, hashes once and signs.
+    """
+    
+    def __init__(self, exchange_address: str, chain_id: int, signer: UtilsSigner):
+        super().__init__(exchange_address, chain_id, signer)
+        self._prefix = b"\x19\x01" + self.domain_separator.hash_struct()
+        self._type_hash = Order.type_hash()
+        self._key = Account._parse_private_key(signer._key)
+        self._addresses: Dict[str, str] = {}
+        self._static_words: Dict[Tuple[str, str, str, int], bytes] = {}
+    
+    def _checksummed(self, address: str) -> str:
+        checksummed = self._addresses.get(address)
+        if checksummed is None:
+            checksummed = self._addresses[address] = normalize_address(address)
+        return checksummed
+    
+    def build_order(self, data: OrderData) -> Order:
+        # Same as the upstream builder, minus re-checksumming every address
+        if not self._validate_inputs(data):
+            raise ValidationException("Invalid order inputs")
+        
+        signer = data.signer if data.signer is not None else data.maker
+        if signer != self.signer.address():
+            raise ValidationException("Signer does not match")
+        
+        return Order(
+            salt=int(self.salt_generator()),
+            maker=self._checksummed(data.maker),
+            signer=self._checksummed(signer),
+            taker=self._checksummed(data.taker),
+            tokenId=int(data.tokenId),
+            makerAmount=int(data.makerAmount),
+            takerAmount=int(data.takerAmount),
+            expiration=int(data.expiration or 0),
+            nonce=int(data.nonce),
+            feeRateBps=int(data.feeRateBps),
+            side=int(data.side),
+            signatureType=int(data.signatureType if data.signatureType is not None else EOA)
+        )
+    
+    def _create_struct_hash(self, order: Order) -> bytes:
+        static_key = (order["maker"], order["signer"], order["taker"], order["tokenId"])
+        static_words = self._static_words.get(static_key)
+        if static_words is None:
+            static_words = self._static_words[static_key] = b"".join(map(_word, static_key))
+        
+        struct_hash = keccak(b"".join((
+            self._type_hash,
+            _word(order["salt"]),
+            static_words,
+            _word(order["makerAmount"]),
+            _word(order["takerAmount"]),
+            _word(order["expiration"]),
+            _word(order["nonce"]),
+            _word(order["feeRateBps"]),
+            _word(order["side"]),
+            _word(order["signatureType"])
+        )))
+        return keccak(self._prefix + struct_hash)
+    
+    def sign(self, struct_hash: bytes) -> str:
+        return Account._sign_hash(struct_hash, self._key).signature.hex()
+
+
+class _FastClobOrderBuilder(ClobOrderBuilder):
+    """
+    py_clob_client order builder that keeps one _PresignedOrderBuilder per
+    exchange contract instead of building a new one (and a new signer) for
+    every order.
+    
+    Installed on a client only after _install_fast_builder has checked it
+    against the stock builder, so an upstream change to the order layout
+    falls back to stock signing instead of producing bad signatures.
+    """
+    
+    def __init__(self, stock: ClobOrderBuilder):
+        super().__init__(stock.signer, sig_type=stock.sig_type, funder=stock.funder)
+        self._utils_builders: Dict[bool, _PresignedOrderBuilder] = {}
+    
+    def forget_keys(self) -> None:
+        """Drop the cached signers (and the parsed keys they hold)."""
+        self._utils_builders.clear()
+    
+    def _utils_builder(self, neg_risk: bool) -> _PresignedOrderBuilder:
+        builder = self._utils_builders.get(neg_risk)
+        if builder is None:
+            chain_id = self.signer.get_chain_id()
+            builder = self._utils_builders[neg_risk] = _PresignedOrderBuilder(
+                get_contract_config(chain_id, neg_risk).exchange,
+                chain_id,
+                UtilsSigner(key=self.signer.private_key)
+            )
+        return builder
+    
+    def _order_data(self, order_args, side, maker_amount, taker_amount, expiration) -> OrderData:
+        # Same fields as ClobOrderBuilder.create_order/create_market_order
+        return OrderData(
+            maker=self.funder,
+            taker=order_args.taker,
+            tokenId=order_args.token_id,
+            makerAmount=str(maker_amount),
+            takerAmount=str(taker_amount),
+            side=side,
+            feeRateBps=str(order_args.fee_rate_bps),
+            nonce=str(order_args.nonce),
+            signer=self.signer.address(),
+            expiration=expiration,
+            signatureType=self.sig_type
+        )
+    
+    def create_order(self, order_args: OrderArgs, options: CreateOrderOptions) -> SignedOrder:
+        side, maker_amount, taker_amount = self.get_order_amounts(
+            order_args.side,
+            order_args.size,
+            order_args.price,
+            ROUNDING_CONFIG[options.tick_size]
+        )
+        data = self._order_data(order_args, side, maker_amount, taker_amount, str(order_args.expiration))
+        return self._utils_builder(options.neg_risk).build_signed_order(data)
+    
+    def create_market_order(self, order_args: MarketOrderArgs, options: CreateOrderOptions) -> SignedOrder:
+        side, maker_amount, taker_amount = self.get_market_order_amounts(
+            order_args.side,
+            order_args.amount,
+            order_args.price,
+            ROUNDING_CONFIG[options.tick_size]
+        )
+        data = self._order_data(order_args, side, maker_amount, taker_amount, "0")
+        return self._utils_builder(options.neg_risk).build_signed_order(data)
+
+
+# Fast builders currently installed, so clear_client_cache() can drop their keys
+_fast_builders: "weakref.WeakSet[_FastClobOrderBuilder]" = weakref.WeakSet()
 
-@dataclass
+# Arbitrary (but valid) token used to sign the warm-up check orders
+_CHECK_TOKEN_ID = "71321045679252212594626385532706912750332728571942532289631379312455583992563"
+
+
+def _fast_builder_matches(stock: ClobOrderBuilder, fast: _FastClobOrderBuilder) -> bool:
+    """
+    Sign check orders through both builders and compare.
+    
+    Salts are random per order, so the fast builder must reproduce everything
+    else in each stock order and re-sign the stock order itself to the same
+    signature (ECDSA here is deterministic).
+    """
+    def unsalted(signed: SignedOrder) -> dict:
+        fields = signed.dict()
+        del fields["salt"], fields["signature"]
+        return fields
+    
+    for neg_risk in (False, True):
+        options = CreateOrderOptions(tick_size="0.01", neg_risk=neg_risk)
+        for create, make_args in (
+            ("create_order", lambda: OrderArgs(token_id=_CHECK_TOKEN_ID, price=0.43, size=7.0, side=SELL)),
+            ("create_market_order", lambda: MarketOrderArgs(token_id=_CHECK_TOKEN_ID, amount=5.0, side=BUY, price=0.5))
+        ):
+            expected = getattr(stock, create)(make_args(), options)
+            actual = getattr(fast, create)(make_args(), options)
+            if unsalted(actual) != unsalted(expected):
+                return False
+            resigned = fast._utils_builder(neg_risk).build_order_signature(expected.order)
+            if resigned != expected.signature:
+                return False
+    return True
+
+
+def _install_fast_builder(client: ClobClient) -> None:
+    """Swap the client's order builder for _FastClobOrderBuilder if it signs identically."""
+    stock = client.builder
+    try:
+        fast = _FastClobOrderBuilder(stock)
+        matches = _fast_builder_matches(stock, fast)
+    except Exception as e:
+        logger.warning("Fast order signing unavailable, using py_clob_client's builder: %s", e)
+        return
+    if not matches:
+        logger.warning("Fast order signing does not match py_clob_client's builder, using the stock one")
+        return
+    client.builder = fast
+    _fast_builders.add(fast)
+
+
+def _parse_midpoint(value) -> Optional[float]:
+    """Price from a CLOB midpoint payload ({"mid": "0.45"} or a bare value)."""
+    if isinstance(value, dict):
+        value = value.get("mid")
+    try:
+        price = float(value)
+    except (TypeError, ValueError):
+        return None
+    return price if price > 0 else None
+
+
+def _parse_order_response(response) -> Tuple[bool, Optional[str], Optional[str]]:
+    """(success, order_id, error) from a CLOB post-order response."""
+    if not response:
+        return False, None, "No response"
+    if not isinstance(response, dict):
+        return False, None, f"Unexpected response: {response!r}"
+    if not response.get("success"):
+        return False, None, response.get("errorMsg") or response.get("error") or "Unknown error"
+    for key in ("orderID", "order_id", "id"):
+        order_id = response.get(key)
+        if order_id:
+            return True, order_id, None
+    return True, "unknown", None
+
+
+def _batch_rejected(error: PolyApiException) -> bool:
+    """
+    True if the CLOB definitely refused a batch POST, so resending its orders
+    one by one cannot duplicate them.
+    
+    Only 4xx answers qualify (minus 408 timeout and 429 rate limit). Transport
+    errors (no status) and 5xx gateway errors may follow an accepted batch.
+    """
+    status = error.status_code
+    return status is not None and 400 <= status < 500 and status not in (408, 429)
+
+
+def _fill_amounts(response: dict) -> Tuple[float, float]:
+    """(makingAmount, takingAmount) filled by a post-order response, 0.0 if absent."""
+    amounts = []
+    for key in ("makingAmount", "takingAmount"):
+        try:
+            amounts.append(float(response.get(key) or 0.0))
+        except (TypeError, ValueError):
+            amounts.append(0.0)
+    return amounts[0], amounts[1]
+
+
+def clear_client_cache() -> None:
+    """Forget cached CLOB clients and API credentials so the next engine derives fresh ones."""
+    _make_client.cache_clear()
+    for builder in list(_fast_builders):
+        builder.forget_keys()
+    for path in API_CREDS_DIR.glob("creds-*.json"):
+        try:
+            path.unlink()
+        except OSError as e:
+            logger.warning("Could not remove API credentials cache %s: %s", path, e)
+
+
+def _load_api_creds(path: Path) -> Optional[ApiCreds]:
+    """API credentials saved by _save_api_creds, or None if absent or unreadable."""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+        return ApiCreds(
+            api_key=data["key"],
+            api_secret=data["secret"],
+            api_passphrase=data["passphrase"]
+        )
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning("Ignoring unreadable API credentials cache %s: %s", path, e)
+        return None
+
+
+def _save_api_creds(path: Path, creds: ApiCreds) -> None:
+    """Write API credentials readable by the owner only (failures are logged, not raised)."""
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({
+                "key": creds.api_key,
+                "secret": creds.api_secret,
+                "passphrase": creds.api_passphrase
+            }, f)
+        os.chmod(path, 0o600)  # The file may predate this run with looser bits
+    except OSError as e:
+        logger.warning("Could not cache API credentials to %s: %s", path, e)
+
+
+@functools.lru_cache(maxsize=None)
+def _make_client(
+    private_key: str,
+    funder: str,
+    chain_id: int,
+    signature_type: int = 1,
+    cache_creds: bool = False
+) -> ClobClient:
+    """
+    Authenticated CLOB client, built once per wallet.
+    
+    Deriving API credentials costs an RPC round-trip and an EIP-712 signature,
+    so engines for the same wallet (e.g. after a bot restart) share the client.
+    With cache_creds the credentials are also kept on disk across processes.
+    """
+    # A key that funds its own orders is a plain EOA, whatever the config says
+    if signature_type != EOA and Account.from_key(private_key).address.lower() == funder.lower():
+        logger.info("Funder is the signing key itself: using EOA signatures (type 0)")
+        signature_type = EOA
+    
+    client = ClobClient(
+        "https://clob.polymarket.com",
+        key=private_key,
+        chain_id=chain_id,
+        signature_type=signature_type,
+        funder=funder
+    )
+    
+    # Credentials belong to the signing key, so the file is named after it
+    creds_path = API_CREDS_DIR / f"creds-{chain_id}-{client.get_address()[:10].lower()}.json"
+    creds = _load_api_creds(creds_path) if cache_creds else None
+    if creds is None:
+        creds = client.create_or_derive_api_creds()
+        if cache_creds:
+            _save_api_creds(creds_path, creds)
+    
+    client.set_api_creds(creds)
+    _install_fast_builder(client)
+    return client
+
+
+@dataclass(slots=True)
 class OrderResult:
     """Result of an order execution.
 
@@ -48,59 +452,109 @@ class TradingEngine:
                 - polygon_private_key: Private key for signing transactions
                 - funder_address: Address holding the funds
                 - chain_id: Polygon chain ID (default: 137)
+                - signature_type: 0 EOA, 1 Magic/email proxy, 2 browser proxy
+                - cache_api_creds: Reuse API credentials saved by a previous run
         """
         self.config = config
         self.logger = logging.getLogger("TradingEngine")
         
-        # Initialize CLOB client
-        try:
-            self.client = ClobClient(
-                "https://clob.polymarket.com",
-                key=config.polygon_private_key,
-                chain_id=config.chain_id,
-                signature_type=1,  # For email/Magic wallet signatures
-                funder=config.funder_address
-            )
-            
-            # Set API credentials
-            self.client.set_api_creds(self.client.create_or_derive_api_creds())
+        # Optional BookFeed; midpoints are read from it before hitting REST
+        self.book_feed = None
+        # token_id -> (midpoint, expiry on the monotonic clock) for REST reads
+        self._midpoint_cache: Dict[str, Tuple[float, float]] = {}
+        
+        # Build the CLOB client (API credential derivation is an RPC plus a
+        # signature) in the background; the first use of self.client waits
+        warmup = ThreadPoolExecutor(max_workers=1, thread_name_prefix="clob-warmup")
+        self._client_future = warmup.submit(
+            _make_client,
+            config.polygon_private_key,
+            config.funder_address,
+            config.chain_id,
+            config.signature_type,
+            config.cache_api_creds
+        )
+        self._client_future.add_done_callback(self._log_client_ready)
+        warmup.shutdown(wait=False)
+    
+    @property
+    def client(self) -> ClobClient:
+        """Authenticated CLOB client; blocks until the warm-up is done, raises if it failed."""
+        return self._client_future.result()
+    
+    def _log_client_ready(self, future: Future) -> None:
+        error = future.exception()
+        if error is None:
             self.logger.info("✅ Polymarket CLOB client initialized")
-            
-        except Exception as e:
-            self.logger.error(f"Failed to initialize CLOB client: {e}")
-            raise
+        else:
+            self.logger.error("Failed to initialize CLOB client: %s", error)
 
     def test_connection(self) -> bool:
-        """Test the CLOB connection.
+        """Test the CLOB connection and the API credentials.
 
         Returns:
             True if connection is successful
+            
+        Raises:
+            PolyApiException: The CLOB rejected the credentials (401/403), so
+                the caller can rebuild the client with fresh ones
         """
         try:
             # Simple connectivity test
+            _READ_LIMIT.acquire()
             server_time = self.client.get_server_time()
             
-            if server_time:
-                self.logger.info(f"✅ Connected to Polymarket CLOB (server time: {server_time})")
-                self.logger.info("💡 Note: Balance check will happen before each trade")
-                return True
-            else:
+            if not server_time:
                 self.logger.error("❌ Failed to get server time")
                 return False
             
+            # Authenticated call: catches revoked or stale cached API keys
+            _READ_LIMIT.acquire()
+            self.client.get_api_keys()
+            
+            self.logger.info("✅ Connected to Polymarket CLOB (server time: %s)", server_time)
+            self.logger.info("💡 Note: Balance check will happen before each trade")
+            return True
+            
+        except PolyApiException as e:
+            if e.status_code in (401, 403):
+                self.logger.error("❌ CLOB rejected the API credentials (%s): %s", e.status_code, e)
+                raise
+            self.logger.error("❌ Connection test failed: %s", e)
+            return False
+            
         except Exception as e:
-            self.logger.error(f"❌ Connection test failed: {e}")
+            self.logger.error("❌ Connection test failed: %s", e)
             return False
 
-    def cancel_all_orders(self) -> None:
-        """Cancel all open orders (if any)."""
+    def cancel_all_orders(self, market: Optional[str] = None) -> bool:
+        """Cancel open orders with a single bulk CLOB request.
+
+        Args:
+            market: Condition ID to cancel orders for only that market (the
+                market-scoped endpoint is faster); None cancels everything
+
+        Returns:
+            True if the cancel request succeeded
+        """
         try:
-            # Get open orders and cancel them
-            # Note: Implement if needed based on SDK capabilities
-            pass
+            _WRITE_LIMIT.acquire()
+            if market is None:
+                response = self.client.cancel_all()
+            else:
+                response = self.client.cancel_market_orders(market=market)
         except Exception as e:
-            self.logger.warning(f"Failed to cancel orders: {e}")
+            self.logger.warning("Failed to cancel orders: %s", e)
+            return False
+        
+        cancelled = response.get("canceled", []) if isinstance(response, dict) else []
+        if cancelled:
+            self.logger.info("🧹 Cancelled %d open orders", len(cancelled))
+        return True
 
+    def recycle(self, result: OrderResult) -> None:
+        """No-op: real order results are not pooled (see PaperTradingEngine.recycle)."""
+    
     def get_midpoint(self, token_id: str) -> Optional[float]:
         """Get the midpoint price for a token.
 
@@ -110,19 +564,36 @@ class TradingEngine:
         Returns:
             Midpoint price or None if not available
         """
+        if self.book_feed is not None:
+            midpoint = self.book_feed.get_midpoint(token_id)
+            if midpoint is not None:
+                return midpoint
+        
+        # Bursts of lookups for the same token share one REST round-trip
+        now = time.monotonic()
+        cached = self._midpoint_cache.get(token_id)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+        
         try:
-            midpoint = self.client.get_midpoint(token_id)
-            return float(midpoint) if midpoint else None
+            _READ_LIMIT.acquire()
+            midpoint = _parse_midpoint(self.client.get_midpoint(token_id))
         except Exception as e:
-            self.logger.error(f"Failed to get midpoint for {token_id}: {e}")
+            self.logger.error("Failed to get midpoint for %s: %s", token_id, e)
             return None
+        
+        if midpoint is not None:
+            if len(self._midpoint_cache) >= MIDPOINT_CACHE_SIZE:
+                self._midpoint_cache.clear()
+            self._midpoint_cache[token_id] = (midpoint, time.monotonic() + MIDPOINT_TTL)
+        return midpoint
     
-    def place_market_order(self, market, direction: str, amount_usdc: float) -> OrderResult:
+    def place_market_order(self, market, direction: Direction, amount_usdc: float) -> OrderResult:
         """Place a market order to buy YES or NO tokens.
         
         Args:
             market: Target market object with token_id_yes and token_id_no
-            direction: "YES" or "NO"
+            direction: Direction.YES/NO (or "YES"/"NO")
             amount_usdc: Amount to spend in USDC
             
         Returns:
@@ -130,9 +601,10 @@ class TradingEngine:
         """
         try:
             # Get the correct token ID based on direction
-            token_id = market.token_id_yes if direction == "YES" else market.token_id_no
+            direction = Direction.coerce(direction)
+            token_id = market.token_id_yes if direction == Direction.YES else market.token_id_no
             
-            self.logger.info(f"📤 Placing {direction} order: ${amount_usdc:.2f} on {market.asset}")
+            self.logger.info("📤 Placing %s order: $%.2f on %s", direction, amount_usdc, market.asset)
             
             # Create market order
             order_args = MarketOrderArgs(
@@ -144,36 +616,111 @@ class TradingEngine:
             
             # Sign and post order
             signed_order = self.client.create_market_order(order_args)
+            _WRITE_LIMIT.acquire()
             response = self.client.post_order(signed_order, OrderType.FOK)
             
-            # Parse response
-            if response and response.get("success"):
-                order_id = response.get("orderID", "unknown")
+            return self._parse_buy_response(response, token_id, amount_usdc)
                 
-                # Get actual execution price
-                midpoint = self.get_midpoint(token_id) or 0.5
-                shares = amount_usdc / midpoint
-                
-                self.logger.info(
-                    f"✅ Order filled: {shares:.2f} shares @ ${midpoint:.3f} "
-                    f"(Order ID: {order_id})"
+        except Exception as e:
+            self.logger.error("❌ Exception placing order: %s", e, exc_info=True)
+            return OrderResult(success=False, error=str(e))
+    
+    def _parse_buy_response(self, response, token_id: str, amount_usdc: float) -> OrderResult:
+        """Turn a CLOB post-order response into an OrderResult.
+        
+        The fill comes from the response itself (USDC made, shares taken). If
+        the server did not report it (e.g. a delayed match), it is estimated
+        from the midpoint here, on the calling CLOB worker thread; shares and
+        avg_price stay 0 only if that lookup fails too.
+        """
+        success, order_id, error_msg = _parse_order_response(response)
+        if success:
+            spent, shares = _fill_amounts(response)
+            spent = spent or amount_usdc
+            if shares:
+                avg_price = spent / shares
+            else:
+                avg_price = self.get_midpoint(token_id) or 0.0
+                shares = spent / avg_price if avg_price else 0.0
+                self.logger.warning(
+                    "Fill not reported for order %s, estimated from midpoint $%.3f",
+                    order_id, avg_price
                 )
+            
+            self.logger.info(
+                "✅ Order filled: %.2f shares @ $%.3f (Order ID: %s)",
+                shares, avg_price, order_id
+            )
+            
+            return OrderResult(
+                success=True,
+                order_id=order_id,
+                shares=shares,
+                avg_price=avg_price,
+                amount_spent=spent
+            )
+        
+        self.logger.error("❌ Order failed: %s", error_msg)
+        return OrderResult(success=False, error=error_msg)
+    
+    def place_market_orders_batch(
+        self,
+        orders: List[Tuple[object, Direction, float]]
+    ) -> List[OrderResult]:
+        """Place several market orders in a single CLOB request.
+        
+        Falls back to one request per order only when the server rejected the
+        batch as a whole (see _batch_rejected); on transport or 5xx errors the
+        batch may have been accepted, so nothing is resubmitted.
+        
+        Args:
+            orders: (market, direction, amount_usdc) tuples
+            
+        Returns:
+            One OrderResult per order, in the same order
+        """
+        try:
+            token_ids = []
+            batch = []
+            for market, direction, amount_usdc in orders:
+                direction = Direction.coerce(direction)
+                token_id = market.token_id_yes if direction == Direction.YES else market.token_id_no
+                self.logger.info("📤 Batching %s order: $%.2f on %s", direction, amount_usdc, market.asset)
                 
-                return OrderResult(
-                    success=True,
-                    order_id=order_id,
-                    shares=shares,
-                    avg_price=midpoint,
-                    amount_spent=amount_usdc
+                order_args = MarketOrderArgs(
+                    token_id=token_id,
+                    amount=amount_usdc,
+                    side=BUY,
+                    order_type=OrderType.FOK
                 )
-            else:
-                error_msg = response.get("error", "Unknown error") if response else "No response"
-                self.logger.error(f"❌ Order failed: {error_msg}")
-                return OrderResult(success=False, error=error_msg)
-                
+                batch.append(PostOrdersArgs(
+                    order=self.client.create_market_order(order_args),
+                    orderType=OrderType.FOK
+                ))
+                token_ids.append(token_id)
+            
+            _WRITE_LIMIT.acquire()
+            responses = self.client.post_orders(batch)
+            
+        except PolyApiException as e:
+            if not _batch_rejected(e):
+                self.logger.error("❌ Batch order request failed (%s): %s", e.status_code, e)
+                return [OrderResult(success=False, error=str(e)) for _ in orders]
+            self.logger.warning("Batch order rejected (%s), placing orders individually", e.status_code)
+            return [self.place_market_order(*order) for order in orders]
+            
         except Exception as e:
-            self.logger.error(f"❌ Exception placing order: {e}", exc_info=True)
-            return OrderResult(success=False, error=str(e))
+            self.logger.error("❌ Exception placing batch order: %s", e, exc_info=True)
+            return [OrderResult(success=False, error=str(e)) for _ in orders]
+        
+        if not isinstance(responses, list) or len(responses) != len(orders):
+            self.logger.error("❌ Unexpected batch order response: %s", responses)
+            return [OrderResult(success=False, error="Unexpected batch response") for _ in orders]
+        
+        return [
+            self._parse_buy_response(response, token_id, amount_usdc)
+            for response, token_id, (_, _, amount_usdc) in zip(responses, token_ids, orders)
+        ]
 
     def sell_position(self, token_id: str, shares: float) -> OrderResult:
         """Sell a position (close by selling tokens).
@@ -186,48 +733,102 @@ class TradingEngine:
             OrderResult with sale proceeds
         """
         try:
-            self.logger.info(f"📤 Selling {shares:.2f} shares of token {token_id}")
-            
-            # Get current price
-            midpoint = self.get_midpoint(token_id)
-            if midpoint is None:
-                return OrderResult(success=False, error="Failed to get price")
-            
-            # Calculate expected proceeds
-            expected_proceeds = shares * midpoint
-            
-            # Create sell market order
-            order_args = MarketOrderArgs(
-                token_id=token_id,
-                amount=expected_proceeds,  # Sell for this much USDC
-                side=SELL,
-                order_type=OrderType.FOK
-            )
+            self.logger.info("📤 Selling %.2f shares of token %s", shares, token_id)
             
             # Sign and post
-            signed_order = self.client.create_market_order(order_args)
+            signed_order = self._create_sell_order(token_id, shares)
+            _WRITE_LIMIT.acquire()
             response = self.client.post_order(signed_order, OrderType.FOK)
             
-            if response and response.get("success"):
-                order_id = response.get("orderID", "unknown")
-                
-                self.logger.info(
-                    f"✅ Position sold: {shares:.2f} shares for ${expected_proceeds:.2f} "
-                    f"(Order ID: {order_id})"
-                )
-                
-                return OrderResult(
-                    success=True,
-                    order_id=order_id,
-                    shares=shares,
-                    avg_price=midpoint,
-                    amount_spent=expected_proceeds  # Proceeds received
-                )
-            else:
-                error_msg = response.get("error", "Unknown error") if response else "No response"
-                self.logger.error(f"❌ Sell failed: {error_msg}")
-                return OrderResult(success=False, error=error_msg)
+            return self._parse_sell_response(response, token_id, shares)
                 
         except Exception as e:
-            self.logger.error(f"❌ Exception selling position: {e}", exc_info=True)
+            self.logger.error("❌ Exception selling position: %s", e, exc_info=True)
             return OrderResult(success=False, error=str(e))
+    
+    def sell_positions_batch(self, sells: List[Tuple[str, float]]) -> List[OrderResult]:
+        """Sell several positions in a single CLOB request.
+        
+        Same fallback rules as place_market_orders_batch: orders are resent
+        one by one only when the server definitely rejected the batch
+        (see _batch_rejected).
+        
+        Args:
+            sells: (token_id, shares) tuples
+            
+        Returns:
+            One OrderResult per sell, in the same order
+        """
+        try:
+            batch = []
+            for token_id, shares in sells:
+                self.logger.info("📤 Batching sell of %.2f shares of token %s", shares, token_id)
+                batch.append(PostOrdersArgs(
+                    order=self._create_sell_order(token_id, shares),
+                    orderType=OrderType.FOK
+                ))
+            
+            _WRITE_LIMIT.acquire()
+            responses = self.client.post_orders(batch)
+            
+        except PolyApiException as e:
+            if not _batch_rejected(e):
+                self.logger.error("❌ Batch sell request failed (%s): %s", e.status_code, e)
+                return [OrderResult(success=False, error=str(e)) for _ in sells]
+            self.logger.warning("Batch sell rejected (%s), selling individually", e.status_code)
+            return [self.sell_position(*sell) for sell in sells]
+            
+        except Exception as e:
+            self.logger.error("❌ Exception placing batch sell: %s", e, exc_info=True)
+            return [OrderResult(success=False, error=str(e)) for _ in sells]
+        
+        if not isinstance(responses, list) or len(responses) != len(sells):
+            self.logger.error("❌ Unexpected batch sell response: %s", responses)
+            return [OrderResult(success=False, error="Unexpected batch response") for _ in sells]
+        
+        return [
+            self._parse_sell_response(response, token_id, shares)
+            for response, (token_id, shares) in zip(responses, sells)
+        ]
+    
+    def _create_sell_order(self, token_id: str, shares: float):
+        """Sign a FOK market sell of shares (SELL market orders are sized in shares)."""
+        order_args = MarketOrderArgs(
+            token_id=token_id,
+            amount=shares,
+            side=SELL,
+            order_type=OrderType.FOK
+        )
+        return self.client.create_market_order(order_args)
+    
+    def _parse_sell_response(self, response, token_id: str, shares: float) -> OrderResult:
+        """Turn a CLOB post-order response for a sell into an OrderResult.
+        
+        Proceeds come from the response (shares made, USDC taken); the midpoint
+        is only queried if the server did not report the fill.
+        """
+        success, order_id, error_msg = _parse_order_response(response)
+        if success:
+            sold, proceeds = _fill_amounts(response)
+            sold = sold or shares
+            if proceeds:
+                avg_price = proceeds / sold
+            else:
+                avg_price = self.get_midpoint(token_id) or 0.0
+                proceeds = sold * avg_price
+            
+            self.logger.info(
+                "✅ Position sold: %.2f shares for $%.2f (Order ID: %s)",
+                sold, proceeds, order_id
+            )
+            
+            return OrderResult(
+                success=True,
+                order_id=order_id,
+                shares=sold,
+                avg_price=avg_price,
+                amount_spent=proceeds  # Proceeds received
+            )
+        
+        self.logger.error("❌ Sell failed: %s", error_msg)
+        return OrderResult(success=False, error=error_msg)
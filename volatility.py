@@ -8,19 +8,114 @@ for mean reversion trading signals.
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional, List
+from enum import IntEnum
+from typing import Optional, Sequence, Union
 
 import numpy as np
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # Optional dependency: run the kernels as plain NumPy
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
 logger = logging.getLogger(__name__)
 
 
+@njit(cache=True, fastmath=True)
+def _zscore_kernel(arr: np.ndarray, current: float) -> float:
+    """Z-Score of current against arr (0 on zero variance)."""
+    m = arr.mean()
+    s = arr.std()
+    if s == 0.0:
+        return 0.0
+    return (current - m) / s
+
+
+# Exit reason codes, in priority order of the checks
+EXIT_NONE = 0
+EXIT_MEAN_REVERSION = 1
+EXIT_OVER_CORRECTION = 2
+EXIT_TIME_EXPIRY = 3
+EXIT_MARKET_CLOSED = 4
+
+
+@njit(cache=True)
+def _exit_codes_loop(
+    zscores: np.ndarray,
+    signs: np.ndarray,
+    times_to_expiry: np.ndarray,
+    threshold: float,
+    force_exit_before_expiry: int
+) -> np.ndarray:
+    """Per-position exit reason code (compiled loop)."""
+    n = zscores.shape[0]
+    out = np.zeros(n, np.uint8)
+    for i in range(n):
+        z = zscores[i]
+        if -threshold <= z <= threshold:
+            out[i] = EXIT_MEAN_REVERSION
+        elif z * signs[i] > threshold:
+            out[i] = EXIT_OVER_CORRECTION
+        elif times_to_expiry[i] <= 0:
+            out[i] = EXIT_MARKET_CLOSED
+        elif times_to_expiry[i] <= force_exit_before_expiry:
+            out[i] = EXIT_TIME_EXPIRY
+    return out
+
+
+def _exit_codes_vectorized(
+    zscores: np.ndarray,
+    signs: np.ndarray,
+    times_to_expiry: np.ndarray,
+    threshold: float,
+    force_exit_before_expiry: int
+) -> np.ndarray:
+    """Per-position exit reason code (NumPy masks, used without Numba)."""
+    return np.select(
+        [
+            np.abs(zscores) <= threshold,
+            zscores * signs > threshold,
+            times_to_expiry <= 0,
+            times_to_expiry <= force_exit_before_expiry,
+        ],
+        [EXIT_MEAN_REVERSION, EXIT_OVER_CORRECTION, EXIT_MARKET_CLOSED, EXIT_TIME_EXPIRY],
+        EXIT_NONE
+    ).astype(np.uint8)
+
+
+# exit_reason_codes(zscores, signs, times_to_expiry, threshold, force_exit_before_expiry)
+# -> uint8 EXIT_* code per position. A plain Python loop would be the slowest
+# option, so without Numba the mask version is used instead.
+exit_reason_codes = _exit_codes_loop if NUMBA_AVAILABLE else _exit_codes_vectorized
+
+
+class Direction(IntEnum):
+    """Betting direction; the value is the sign of the bet on the Z-Score."""
+    
+    YES = 1
+    NO = -1
+    
+    def __str__(self) -> str:
+        return self.name
+    
+    @classmethod
+    def coerce(cls, value: Union["Direction", str]) -> "Direction":
+        """Accept a Direction or its name ("YES"/"NO")."""
+        return value if isinstance(value, cls) else cls[value]
+
+
 @dataclass
 class Signal:
     """Trading signal generated by volatility detector."""
     
     asset: str                    # "BTC" or "ETH"
-    direction: str                # "YES" or "NO" (betting direction)
+    direction: Direction          # YES or NO (betting direction)
     price_direction: str          # "UP" or "DOWN" (price movement detected)
     zscore: float                 # Z-Score value that triggered signal
     pct_move: float               # Percentage move value
@@ -66,7 +161,7 @@ class VolatilityDetector:
     
     def calculate_zscore(
         self,
-        prices: List[float],
+        prices: Sequence[float],
         current_price: float
     ) -> float:
         """
@@ -84,10 +179,30 @@ class VolatilityDetector:
         if len(prices) < self.min_samples:
             return 0.0
         
-        arr = np.array(prices)
-        mean = arr.mean()
-        std = arr.std()
+        arr = np.asarray(prices, dtype=np.float64)
+        zscore = _zscore_kernel(arr, float(current_price))
+        return 0.0 if np.isnan(zscore) else float(zscore)
+    
+    def zscore_from_stats(
+        self,
+        current_price: float,
+        mean: float,
+        std: float
+    ) -> float:
+        """
+        Calculate Z-Score from precomputed window mean and standard deviation.
+        
+        Lets callers holding running moments (see PriceWindow.mean/std) skip
+        the O(n) pass over the price history.
         
+        Args:
+            current_price: Current/latest price
+            mean: Mean of the price window
+            std: Population standard deviation of the price window
+            
+        Returns:
+            Z-Score value (0 if zero variance)
+        """
         if std == 0 or np.isnan(std):
             return 0.0
         
@@ -96,7 +211,7 @@ class VolatilityDetector:
     
     def calculate_pct_move(
         self,
-        prices: List[float],
+        prices: Sequence[float],
         current_price: float
     ) -> float:
         """
@@ -109,7 +224,7 @@ class VolatilityDetector:
         Returns:
             Percentage move as decimal (e.g., 0.01 = 1%)
         """
-        if not prices:
+        if len(prices) == 0:
             return 0.0
         
         first_price = prices[0]
@@ -121,7 +236,7 @@ class VolatilityDetector:
     
     def calculate_volatility_metrics(
         self,
-        prices: List[float],
+        prices: Sequence[float],
         current_price: float
     ) -> tuple[float, float, float, float]:
         """
@@ -137,7 +252,7 @@ class VolatilityDetector:
         if len(prices) < self.min_samples:
             return 0.0, 0.0, 0.0, 0.0
         
-        arr = np.array(prices)
+        arr = np.asarray(prices)
         mean = float(arr.mean())
         std = float(arr.std())
         
@@ -148,7 +263,7 @@ class VolatilityDetector:
     
     def calculate_rsi(
         self,
-        prices: List[float],
+        prices: Sequence[float],
         period: int = 14
     ) -> float:
         """
@@ -190,7 +305,7 @@ class VolatilityDetector:
     def check_entry_signal(
         self,
         asset: str,
-        prices: List[float],
+        prices: Sequence[float],
         current_price: float
     ) -> Optional[Signal]:
         """
@@ -218,7 +333,7 @@ class VolatilityDetector:
         # Determine if we have a signal (with RSI confirmation)
         signal_triggered = False
         price_direction = ""
-        bet_direction = ""
+        bet_direction = None
         confidence = 0.0
         
         # ADJUSTED THRESHOLD: 2.5 -> 2.2 for more sensitivity
@@ -230,7 +345,7 @@ class VolatilityDetector:
             if rsi > 70:
                 signal_triggered = True
                 price_direction = "UP"
-                bet_direction = "NO"
+                bet_direction = Direction.NO
                 # Confidence: combination of Z-Score + RSI overbought strength
                 zscore_conf = abs(zscore) / (zscore_entry_threshold * 2)
                 rsi_conf = (rsi - 70) / 30  # 0-1 range for RSI above 70
@@ -248,7 +363,7 @@ class VolatilityDetector:
             if rsi < 30:
                 signal_triggered = True
                 price_direction = "DOWN"
-                bet_direction = "YES"
+                bet_direction = Direction.YES
                 # Confidence: combination of Z-Score + RSI oversold strength
                 zscore_conf = abs(zscore) / (zscore_entry_threshold * 2)
                 rsi_conf = (30 - rsi) / 30  # 0-1 range for RSI below 30
@@ -284,7 +399,7 @@ class VolatilityDetector:
     def check_exit_signal(
         self,
         asset: str,
-        prices: List[float],
+        prices: Sequence[float],
         current_price: float,
         entry_zscore: float
     ) -> bool:
@@ -328,7 +443,7 @@ class VolatilityDetector:
     def get_market_state(
         self,
         asset: str,
-        prices: List[float],
+        prices: Sequence[float],
         current_price: float
     ) -> dict:
         """